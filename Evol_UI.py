@@ -1,22 +1,82 @@
+import os
 import sys
-import random
-from functools import partial
+import tempfile
+import threading
+from collections import deque
 from PyQt5 import QtCore 
 from PyQt5.QtCore import QThread, pyqtSignal
-from PyQt5.QtWidgets import QApplication, QSizePolicy, QTextEdit, QMainWindow, QPushButton, QFrame, QSlider, QComboBox, QVBoxLayout, QGridLayout, QLabel, QWidget
-from PyQt5.QtGui import QPalette, QColor, QTextCursor
+from PyQt5.QtWidgets import QApplication, QSizePolicy, QTextEdit, QMainWindow, QFrame, QSlider, QComboBox, QVBoxLayout, QLabel, QWidget, QFileDialog, QShortcut
+from PyQt5.QtGui import QPalette, QColor, QTextCursor, QKeySequence
 from PyQt5.QtCore import QTimer, Qt, QRect
 from ui import Ui_Dialog  
+import checkpoint
+import engine
+import fitness
+import metrics
+import patterns
+import recording
+from engine import LifeEngine
+from grid_canvas import GridCanvas
+from workers import EvolutionWorker, SimulationWorker
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
+PLOT_HISTORY = 10_000  # Samples kept for the fitness plot; older ones are overwritten
+PLOT_POINTS = 500  # Samples actually drawn, after downsampling
+LOG_MAX_LINES = 1000  # Lines kept in the log widget
+LOG_FLUSH_INTERVAL = 200  # Milliseconds between log widget updates
+EVOLUTION_CHECKPOINT = os.path.join(tempfile.gettempdir(), "game_of_life_evolution.npz")  # Removed when a run completes
+
+
 class Logs:
     @staticmethod
     def app_msg(message):
         print(f"LOG: {message}")
 
+
+class LogSink:
+    """Batches messages for a QTextEdit and keeps only its last ``max_lines`` lines.
+
+    Messages are queued and written together at most every ``interval`` ms,
+    so a burst of log calls costs one widget update; the document drops its
+    oldest lines beyond the cap.
+    """
+
+    def __init__(self, widget, max_lines=LOG_MAX_LINES, interval=LOG_FLUSH_INTERVAL):
+        self.widget = widget
+        self.widget.document().setMaximumBlockCount(max_lines)
+        self.pending = deque(maxlen=max_lines)  # Anything older would be dropped by the widget anyway
+        self.timer = QTimer(widget)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.flush)
+
+    def write(self, message):
+        self.pending.append(message)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def flush(self):
+        """Writes every queued message to the widget in one edit and scrolls to the bottom."""
+        if not self.pending:
+            return
+        text = "\n".join(self.pending)
+        self.pending.clear()
+        document = self.widget.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text if document.isEmpty() else "\n" + text)
+        scroll_bar = self.widget.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+
+
 class GameOfLife(QMainWindow):
+    # Requests to the simulation worker, delivered on its thread
+    simulationStartRequested = pyqtSignal(int)
+    simulationStopRequested = pyqtSignal()
+    simulationIntervalChanged = pyqtSignal(int)
+
     def __init__(self):
         super().__init__()
         self.ui = Ui_Dialog()
@@ -35,6 +95,7 @@ class GameOfLife(QMainWindow):
         
         self.ui.Logger_QText.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)  
         self.ui.Logger_QText.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+        self.log_sink = LogSink(self.ui.Logger_QText)
 
         self.set_white_palette()  
 
@@ -43,30 +104,57 @@ class GameOfLife(QMainWindow):
         # Initialize grid settings
         self.rows = 20
         self.cols = 20
-        self.grid = [[0] * self.cols for _ in range(self.rows)]
+        self.engine = LifeEngine(self.rows, self.cols)  # Headless simulation; the UI only observes it
+        self.engine_lock = threading.Lock()  # Shared with the simulation worker thread
+        self.fitness_executor = None  # Process pool for evolutionary fitness, created on first use
+        self.fitness_workers = os.cpu_count() or 1
+        self.fitness_cache = fitness.FitnessCache(symmetric=True)  # Scores shared across evolution runs
 
-        self.grid_layout = QGridLayout()
-        self.cells = [[QPushButton() for _ in range(self.cols)] for _ in range(self.rows)]
-        self.setup_grid()  # Set up grid of buttons
+        self.grid_layout = QVBoxLayout()
+        self.grid_canvas = GridCanvas()
+        self.setup_grid()  # Set up the grid canvas
 
         self.ui.GridFrame.setLayout(self.grid_layout)
 
+        # Recording and playback of runs: Ctrl+R starts/stops recording, Ctrl+O opens a recording to scrub
+        self.recording = None
+        self.playback_slider = QSlider(Qt.Horizontal)
+        self.playback_slider.hide()
+        self.playback_slider.valueChanged.connect(self.show_recorded_generation)
+        self.grid_layout.addWidget(self.playback_slider)
+        QShortcut(QKeySequence("Ctrl+R"), self, activated=self.toggle_recording)
+        QShortcut(QKeySequence("Ctrl+O"), self, activated=self.open_recording)
+
+        # Ctrl+B cycles what lies past the grid edge: dead cells, a torus, or an unbounded board
+        QShortcut(QKeySequence("Ctrl+B"), self, activated=self.cycle_boundary)
+
         # Connect UI buttons to methods
         self.ui.Start.clicked.connect(self.start_game)
         self.ui.Stop.clicked.connect(self.stop_game)
         self.ui.Clear.clicked.connect(self.clear_grid)
         self.ui.AddPattern.clicked.connect(self.add_pattern)
-        self.ui.Evolutionary_Computation.clicked.connect(self.run_evolutionary_algorithm)
-
-        # Set up timers for grid and plot updates
-        self.grid_timer = QTimer()
-        self.grid_timer.timeout.connect(self.update_grid)
-
+        self.ui.Evolutionary_Computation.clicked.connect(lambda: self.run_evolutionary_algorithm())
+
+        # Run the simulation on a worker thread; the GUI only paints the latest frame
+        self.sim_thread = QThread(self)
+        self.sim_worker = SimulationWorker(self.engine, self.engine_lock)
+        self.sim_worker.moveToThread(self.sim_thread)
+        self.sim_thread.started.connect(self.sim_worker.setup)
+        self.sim_thread.finished.connect(self.sim_worker.teardown)
+        self.sim_worker.frameReady.connect(self.update_grid)
+        self.simulationStartRequested.connect(self.sim_worker.start)
+        self.simulationStopRequested.connect(self.sim_worker.stop)
+        self.simulationIntervalChanged.connect(self.sim_worker.set_interval)
+        self.sim_thread.start()
+
+        self.evolution_thread = None  # Background thread of a running evolution, if any
+
+        # Set up timer for plot updates
         self.plot_update_timer = QTimer(self)
         self.plot_update_timer.timeout.connect(self.update_plot)
 
-        # Set up speed control slider
-        self.ui.SpeedSlider.setMinimum(200)
+        # Set up speed control slider (milliseconds per generation, 0 = as fast as possible)
+        self.ui.SpeedSlider.setMinimum(0)
         self.ui.SpeedSlider.setMaximum(2000)
         self.ui.SpeedSlider.setValue(1000)  
         self.ui.SpeedSlider.valueChanged.connect(self.update_speed)
@@ -75,11 +163,15 @@ class GameOfLife(QMainWindow):
 
         self.game_running = False  # Game state flag
 
-        # Add patterns to combo box
-        self.ui.comboBox.addItems(["Glider", "Blinker", "Toad", "Beacon", "Pulsar", "Glider Gun"])
+        # Add patterns from the pattern library to combo box
+        self.pattern_library = patterns.PatternLibrary()
+        self.ui.comboBox.addItems(self.pattern_library.names())
+        for file_name, error in self.pattern_library.errors.items():
+            self.log_message(f"Skipped pattern file {file_name}: {error}")
 
-        # Initialize plot tracking
-        self.fitness_history = []  
+        # Initialize plot tracking; the history is a ring buffer, so its cost stays bounded on long runs
+        self.plot_history = metrics.RingBuffer(PLOT_HISTORY)
+        self.plot_mode = None  # "run" (population per generation) or "evolution" (best fitness per generation)
         self.current_generation = 0
 
         # Set up the fitness plot
@@ -87,7 +179,8 @@ class GameOfLife(QMainWindow):
         self.ax.set_title("Fitness over Generations")
         self.ax.set_xlabel("Generation")
         self.ax.set_ylabel("Fitness")
-        self.line, = self.ax.plot([], [], marker='o')  
+        self.line, = self.ax.plot([], [], marker='o', animated=True)  # Drawn by blitting, see redraw_plot
+        self.plot_background = None
 
         # Add canvas to plot frame layout if not already set
         if not self.ui.PlotFrame.layout():
@@ -95,6 +188,7 @@ class GameOfLife(QMainWindow):
             self.ui.PlotFrame.setLayout(plot_layout)
 
         self.canvas = FigureCanvas(self.fig)
+        self.canvas.mpl_connect("draw_event", self.on_plot_drawn)
         self.ui.PlotFrame.layout().addWidget(self.canvas)
 
         # Ensure canvas resizes with window
@@ -106,10 +200,8 @@ class GameOfLife(QMainWindow):
         self.canvas.draw()  
 
     def log_message(self, message):
-        """Appends a message to the Logger_QText widget."""
-        print(f"Logging message: {message}")  # Print to console
-        self.ui.Logger_QText.append(message)  # Append message to the widget
-        self.ui.Logger_QText.ensureCursorVisible()  # Ensure cursor stays at the bottom
+        """Queues a message for the Logger_QText widget; see LogSink."""
+        self.log_sink.write(message)
 
     def resizeEvent(self, event):
         # Resize canvas when window size changes
@@ -117,29 +209,67 @@ class GameOfLife(QMainWindow):
         event.accept()
 
     def update_plot(self):
-        """Update the plot with new data if the game is running and there are alive cells."""
+        """Plots the live population and logs the run's metrics, once per plot tick."""
         if not self.game_running:
             return  # No update if game is stopped
 
-        # Check for any live cells
-        any_alive = any(any(cell == 1 for cell in row) for row in self.grid)
-
-        if any_alive:  # Only update if there are alive cells
-            self.current_generation += 1
-            fitness_value = random.uniform(0, 100)  # Random fitness value
-            self.fitness_history.append(fitness_value)
-
-            # Log the fitness data
-            self.logs.app_msg(f"Generation {self.current_generation}: Fitness = {fitness_value:.2f}")
-            self.log_message(f"Generation {self.current_generation}: Fitness = {fitness_value:.2f}")
-            
-            # Update the plot
-            self.line.set_data(range(self.current_generation), self.fitness_history)
-
-            # Redraw the canvas with updated data
-            self.ax.relim()  # Recalculate axis limits
-            self.ax.autoscale_view()  # Adjust to fit data
-            self.canvas.draw()  # Redraw canvas
+        snapshot = metrics.REGISTRY.snapshot()
+        gauges, step_timer = snapshot["gauges"], snapshot["timers"].get("step")
+        population = gauges.get("population", 0)
+        if population == 0 or gauges.get("generation", 0) == self.current_generation:
+            return  # Only update while there are alive cells and new generations
+
+        self.current_generation = gauges["generation"]
+        self.set_plot_mode("run")
+        self.plot_history.append(self.current_generation, population)  # Population is the fitness the evolution maximises
+
+        step_time = f", step {step_timer['mean'] * 1000:.2f} ms" if step_timer else ""
+        message = (f"Generation {self.current_generation}: Population = {population}, "
+                   f"births {gauges.get('births', 0)}, deaths {gauges.get('deaths', 0)}{step_time}")
+        if "fitness_cache_hit_rate" in gauges:
+            message += f", cache hit rate {gauges['fitness_cache_hit_rate']:.0%}"
+        self.log_message(message)
+        self.redraw_plot()
+
+    def set_plot_mode(self, mode):
+        """Starts a fresh plot when switching between live runs and evolutions, whose x axes differ."""
+        if mode == self.plot_mode:
+            return
+        self.plot_mode = mode
+        self.plot_history.clear()
+        self.ax.set_ylabel("Population" if mode == "run" else "Best fitness")
+        self.plot_background = None  # The next redraw refits the axes to the new series
+
+    def redraw_plot(self):
+        """Updates the fitness line from the downsampled history.
+
+        While the data fits the current axes only the line is redrawn over a
+        cached background (blitting). When it outgrows them the limits are
+        widened with headroom and the whole figure is drawn once.
+        """
+        xs, ys = self.plot_history.downsample(PLOT_POINTS)
+        self.line.set_data(xs, ys)
+        if not len(xs):
+            self.canvas.draw()
+            return
+
+        (x_low, x_high), (y_low, y_high) = self.ax.get_xlim(), self.ax.get_ylim()
+        x_min, x_max, y_min, y_max = xs.min(), xs.max(), ys.min(), ys.max()
+        if self.plot_background is None or x_min < x_low or x_max > x_high or y_min < y_low or y_max > y_high:
+            x_span, y_span = max(x_max - x_min, 1), max(y_max - y_min, 1)
+            self.ax.set_xlim(x_min, x_max + x_span)  # Room to grow before the next full redraw
+            self.ax.set_ylim(min(0, y_min), y_max + y_span / 2)
+            self.canvas.draw()  # on_plot_drawn caches the background and draws the line
+            return
+
+        self.canvas.restore_region(self.plot_background)
+        self.ax.draw_artist(self.line)
+        self.canvas.blit(self.ax.bbox)
+
+    def on_plot_drawn(self, event):
+        """Caches the freshly drawn axes as the blitting background and draws the line on top."""
+        self.plot_background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.line)
 
     def set_white_palette(self):
         white_palette = QPalette()
@@ -159,143 +289,63 @@ class GameOfLife(QMainWindow):
         QApplication.setPalette(white_palette)
 
     def setup_grid(self):
-        for i in range(self.rows):
-            for j in range(self.cols):
-                cell_button = self.cells[i][j]
-                cell_button.setFixedSize(30, 30) 
-                cell_button.setStyleSheet("background-color: #f0f0f0; border: 1px solid #ccc;")
-                cell_button.clicked.connect(partial(self.toggle_cell, i, j))  
-                self.grid_layout.addWidget(cell_button, i, j)
+        self.grid_layout.setContentsMargins(0, 0, 0, 0)
+        self.grid_layout.addWidget(self.grid_canvas)
+        self.grid_canvas.cellClicked.connect(self.toggle_cell)
+        self.grid_canvas.set_board(self.engine.board)
 
     def toggle_cell(self, x, y):
         """Toggles the state of a cell when clicked."""
-        self.grid[x][y] = 1 - self.grid[x][y]  # Switch between alive (1) and dead (0)
-        self.update_button_style(x, y) 
-
-    def update_button_style(self, x, y):
-        """Updates the button color based on the cell state."""
-        if self.grid[x][y] == 1:
-            self.cells[x][y].setStyleSheet("background-color: #21c362; border: 2px solid #ccc; border-radius: 5px;")  # Green for alive
-        else:
-            self.cells[x][y].setStyleSheet("background-color: #f0f0f0; border: 2px solid #ccc; border-radius: 5px;")  # Light color for dead
+        with self.engine_lock:
+            self.engine.toggle(x, y)  # Switch between alive (1) and dead (0)
+        self.update_canvas()
 
 
     def start_game(self):
         """Start the game and initialize the grid."""
+        self.close_recording()  # Leave playback and show the live board again
         self.game_running = True
-        self.grid_timer.start(self.ui.SpeedSlider.value())  # Start grid update timer
+        self.simulationStartRequested.emit(self.ui.SpeedSlider.value())  # Start the simulation worker
         self.plot_update_timer.start(1000)  # Start plot update timer
         self.logs.app_msg("Game started!")
 
     def stop_game(self):
         """Stop the game and stop all timers."""
         self.game_running = False
-        self.grid_timer.stop()  # Stop grid update timer
+        self.simulationStopRequested.emit()  # Stop the simulation worker
         self.plot_update_timer.stop()  # Stop plot update timer
 
     def clear_grid(self):
         """Clears the grid."""
-        self.grid = [[0] * self.cols for _ in range(self.rows)]  # Reset grid to all dead cells
-        self.update_buttons()
+        with self.engine_lock:
+            self.engine.clear()  # Reset grid to all dead cells
+        self.update_canvas()
 
     def add_pattern(self):
-        """Adds a pattern to the grid based on the selected combo box item."""
-        pattern = self.ui.comboBox.currentText()
-        if pattern == "Glider":
-            self.add_glider()
-        elif pattern == "Blinker":
-            self.add_blinker()
-        elif pattern == "Toad":
-            self.add_toad()
-        elif pattern == "Beacon":
-            self.add_beacon()
-        elif pattern == "Pulsar":
-            self.add_pulsar()
-        elif pattern == "Glider Gun":
-            self.add_glider_gun()
-        self.update_buttons()
-
-    def add_glider(self):
-        """Adds a glider pattern to the grid."""
-        glider = [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]
-        self.add_pattern_to_grid(glider)
-
-    def add_blinker(self):
-        """Adds a blinker pattern to the grid."""
-        blinker = [(1, 0), (1, 1), (1, 2)]
-        self.add_pattern_to_grid(blinker)
-
-    def add_toad(self):
-        """Adds a toad pattern to the grid."""
-        toad = [(1, 0), (1, 1), (1, 2), (0, 2), (0, 3), (0, 4)]
-        self.add_pattern_to_grid(toad)
-
-    def add_beacon(self):
-        """Adds a beacon pattern to the grid."""
-        beacon = [(1, 1), (1, 2), (2, 1), (2, 2), (0, 0), (0, 1), (1, 0), (2, 0)]
-        self.add_pattern_to_grid(beacon)
-
-    def add_pulsar(self):
-        """Adds a pulsar pattern to the grid."""
-        pulsar = [
-            (2, 1), (2, 2), (2, 3),
-            (3, 1), (3, 2), (3, 3),
-            (4, 1), (4, 2), (4, 3),
-            (1, 4), (2, 4), (3, 4),
-            (4, 4), (5, 1), (5, 2),
-            (5, 3), (1, 2), (1, 3)
-        ]
-        self.add_pattern_to_grid(pulsar)
-
-    def add_glider_gun(self):
-        """Adds a glider gun pattern to the grid."""
-        glider_gun = [
-            (5, 1), (5, 2), (6, 1), (6, 2),
-            (5, 11), (6, 11), (7, 11), (4, 12),
-            (5, 12), (6, 12), (3, 13), (7, 13),
-            (4, 14), (8, 14), (5, 15), (6, 15),
-            (5, 16), (6, 16), (5, 17), (4, 18),
-            (5, 18), (6, 18), (6, 19), (7, 19),
-            (5, 21), (6, 21), (7, 21), (5, 22),
-            (6, 22), (7, 22), (6, 23)
-        ]
-        self.add_pattern_to_grid(glider_gun)
-        
-    def add_pattern_to_grid(self, pattern):
-        """Adds a specified pattern to the grid."""
-        for x, y in pattern:
-            if 0 <= x < self.rows and 0 <= y < self.cols:
-                self.grid[x][y] = 1  # Set cell to alive
-                self.cells[x][y].setStyleSheet("background-color: black;") 
-
+        """Adds the pattern selected in the combo box to the top-left of the grid."""
+        name = self.ui.comboBox.currentText()
+        if not name:
+            return
+        try:
+            pattern = self.pattern_library.load(name)
+        except (ValueError, OSError) as error:  # Changed or removed since the library was indexed
+            self.log_message(f"Could not load {name}: {error}")
+            return
+        with self.engine_lock:
+            fits = self.engine.add_cells(pattern.cells)
+        if not fits:
+            self.log_message(f"{name} is {pattern.cols}x{pattern.rows} and was clipped to the {self.cols}x{self.rows} grid")
+        self.update_canvas()
 
     def update_grid(self):
-        """Updates the grid based on the Game of Life rules."""
-        
-        if not self.game_running:
+        """Paints the latest generation published by the simulation worker."""
+        frame = self.sim_worker.frames.take()  # Frames published since the last paint are skipped
+
+        if frame is None or not self.game_running:
             return  # Exit early if the game is not running
-        
-        new_grid = [[0] * self.cols for _ in range(self.rows)]  # Create a new grid for the next generation
-
-        # Iterate over each cell to apply Game of Life rules
-        for x in range(self.rows):
-            for y in range(self.cols):
-                alive_neighbors = self.count_alive_neighbors(x, y)  # Count alive neighbors
-
-                # Apply Game of Life rules
-                if self.grid[x][y] == 1:  # Cell is alive
-                    if alive_neighbors in [2, 3]:  # Stay alive with 2 or 3 neighbors
-                        new_grid[x][y] = 1
-                    else:  # Die if not 2 or 3 neighbors
-                        new_grid[x][y] = 0
-                else:  # Cell is dead
-                    if alive_neighbors == 3:  # Become alive if exactly 3 neighbors
-                        new_grid[x][y] = 1
-                    else:
-                        new_grid[x][y] = 0
-
-        self.grid = new_grid  # Update the grid with the new generation
-        self.update_buttons() 
+
+        with metrics.REGISTRY.timer("render"):
+            self.grid_canvas.set_board(frame.board)
 
     def plot_update(self):
         """Update the plot with the current grid state."""
@@ -303,143 +353,191 @@ class GameOfLife(QMainWindow):
         if not self.game_running:
             return  # Skip plot update if the game is not running
 
-        self.plot_grid(self.grid) 
-
-    def count_alive_neighbors(self, x, y):
-        """Counts the number of alive neighbors of a given cell (x, y)."""
-        neighbors = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
-        count = 0
-        for dx, dy in neighbors:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < self.rows and 0 <= ny < self.cols:  # Check for boundary conditions
-                count += self.grid[nx][ny]
-        return count
+        self.plot_grid(self.engine.board) 
 
-    def update_buttons(self):
-        """Updates the button styles based on the current grid state."""
-        for i in range(self.rows):
-            for j in range(self.cols):
-                self.update_button_style(i, j) 
+    def update_canvas(self):
+        """Redraws the cells that changed since the last frame."""
+        with self.engine_lock:
+            self.grid_canvas.set_board(self.engine.board)
 
     def update_speed(self):
         """Updates the speed of the game based on slider value."""
-        self.grid_timer.setInterval(self.ui.SpeedSlider.value())  # Set the grid update timer interval
+        self.simulationIntervalChanged.emit(self.ui.SpeedSlider.value())  # Time between generations
 
     def display_pattern(self, pattern):
         """Displays a given pattern on the grid."""
-        for x in range(self.rows):
-            for y in range(self.cols):
-                self.grid[x][y] = pattern[x][y]  # Set grid cell to the pattern value
-        self.update_buttons()
+        with self.engine_lock:
+            self.engine.load(pattern)
+        self.update_canvas()
         
     def run_evolutionary_algorithm(self, generations=10, population_size=20):
-        """Runs an evolutionary algorithm to find an optimal starting pattern."""
-        # Initialize population with random patterns
-        population = [self.generate_random_pattern() for _ in range(population_size)]
-        
-        best_pattern = None  # Initialize the best pattern variable
+        """Starts an evolutionary search for an optimal starting pattern on a background thread."""
+        if self.evolution_thread is not None:
+            return  # An evolution is already running
 
         print(f"self.logs is: {self.logs}") 
         self.logs.app_msg("Starting evolutionary computation...") 
         
         self.log_message("Starting evolutionary computation...")
 
-        for generation in range(generations):
-            # Step 1: Evaluate fitness of each pattern in the population
-            fitness_scores = [self.evaluate_fitness(pattern) for pattern in population]
-            
-            # Track the best fitness of this generation
-            best_fitness = max(fitness_scores)
-            self.fitness_history.append(best_fitness)
-            self.current_generation = generation + 1
-
-            # Log the progress for the current generation
-            self.logs.app_msg(f"Generation {generation + 1}/{generations}: Best Fitness = {best_fitness}")
-            try:
-                self.log_message(f"Generation {generation + 1}/{generations}: Best Fitness = {best_fitness}")
-            except Exception as e:
-                print(f"Error in logging: {e}")
-
-            # Step 2: Selection - keep top 50% of the population
-            selected_population = [population[i] for i in sorted(range(len(fitness_scores)), key=lambda i: fitness_scores[i], reverse=True)[:population_size // 2]]
-            
-            # Step 3: Crossover and mutation to create new patterns
-            new_population = selected_population[:]
-            while len(new_population) < population_size:
-                parent1, parent2 = random.sample(selected_population, 2)  # Select two parents
-                child = self.crossover(parent1, parent2)  # Create child pattern from parents
-                self.mutate(child)  # Apply mutation to the child pattern
-                new_population.append(child)
-            
-            # Update population for the next generation
-            population = new_population
-
-            # Update plot with the best fitness so far
-            self.update_plot()
-
-            # Refresh the plot display
-            self.canvas.draw()
+        # Fitness is scored in worker processes; the pool is kept for later runs
+        if self.fitness_executor is None:
+            self.fitness_executor = fitness.make_executor(self.fitness_workers)
+
+        # A checkpoint left by an interrupted run with the same settings is picked up where it stopped
+        settings = dict(rows=self.rows, cols=self.cols, population_size=population_size, fitness_generations=10,
+                        boundary=self.engine.boundary, rule=str(self.engine.rule))
+        resume = self.can_resume_evolution(settings)
+        if resume:
+            self.log_message("Resuming the interrupted evolution from its checkpoint")
+
+        self.ui.Evolutionary_Computation.setEnabled(False)
+        self.evolution_thread = QThread(self)
+        self.evolution_worker = EvolutionWorker(
+            generations=generations, executor=self.fitness_executor, workers=self.fitness_workers,
+            cache=self.fitness_cache,
+            checkpoint=EVOLUTION_CHECKPOINT, resume=resume, **settings,
+        )
+        self.evolution_worker.moveToThread(self.evolution_thread)
+        self.evolution_thread.started.connect(self.evolution_worker.run)
+        self.evolution_worker.progress.connect(self.on_evolution_generation)
+        self.evolution_worker.finished.connect(self.on_evolution_finished)
+        self.evolution_thread.start()
+
+    def can_resume_evolution(self, settings):
+        """Returns True if the evolution checkpoint exists and was written with these settings."""
+        if not os.path.exists(EVOLUTION_CHECKPOINT):
+            return False
+        try:
+            checkpoint.load_checkpoint(EVOLUTION_CHECKPOINT).check("evolve", **settings)
+            return True
+        except (OSError, ValueError, KeyError):
+            os.remove(EVOLUTION_CHECKPOINT)  # Unreadable or from other settings: start afresh
+            return False
+
+    def on_evolution_finished(self, result):
+        """Shows the best pattern once the background evolution is done."""
+        self.evolution_thread.quit()
+        self.evolution_thread.wait()
+        if os.path.exists(EVOLUTION_CHECKPOINT):
+            os.remove(EVOLUTION_CHECKPOINT)  # Completed, so the next run starts afresh
+        self.evolution_thread = None
+        self.evolution_worker = None
+        self.ui.Evolutionary_Computation.setEnabled(True)
+
+        stats = self.fitness_cache.stats()
+        self.logs.app_msg(f"Fitness cache: {stats['hits']} hits, {stats['misses']} misses")
 
-        # Step 4: Find the best pattern from the population and update the grid
-        best_pattern = max(population, key=self.evaluate_fitness)  # Find the best pattern based on fitness
-        
         # Log the completion of evolutionary process
         self.logs.app_msg("Evolution completed. Setting grid to the best pattern.")
         self.log_message("Evolution completed. Setting grid to the best pattern.")
         
         # Update the grid with the best pattern found
-        for x in range(self.rows):
-            for y in range(self.cols):
-                self.grid[x][y] = best_pattern[x][y]  # Set the grid cells to the best pattern
-        
-        self.update_buttons()
-
-    def generate_random_pattern(self):
-
-        """Generates a random pattern for the grid."""
-        return [[random.choice([0, 1]) for _ in range(self.cols)] for _ in range(self.rows)]
-
-    def evaluate_fitness(self, pattern):
-        """Evaluates the fitness of a pattern based on how many cells are alive after 10 generations."""
-        
-        # Set the grid to the given pattern
-        self.grid = pattern
-        
-        # Simulate the grid for 10 generations
-        for _ in range(10):
-            self.update_grid()  # Update the grid based on Game of Life rules
-        
-        # Count the number of alive cells after 10 generations
-        alive_cells = sum([sum(row) for row in self.grid])
-
-        return alive_cells
-
-
-    def count_alive_neighbors_in_grid(self, grid, x, y):
-        """Counts the number of alive neighbors for a given cell in a specific grid."""
-        count = 0
-        for i in range(max(0, x - 1), min(self.rows, x + 2)):
-            for j in range(max(0, y - 1), min(self.cols, y + 2)):
-                if (i == x and j == y):
-                    continue
-                count += grid[i][j]
-        return count
-
-    def crossover(self, parent1, parent2):
-        """Performs crossover between two patterns."""
-        # Simple crossover logic: mix the first half of one parent and the second half of the other
-        return [
-            [parent1[x][y] if x < self.rows // 2 else parent2[x][y] for y in range(self.cols)]
-            for x in range(self.rows)
-        ]
-
-    def mutate(self, pattern):
-        """Mutates the given pattern by flipping a random cell."""
-        x = random.randint(0, self.rows - 1)
-        y = random.randint(0, self.cols - 1)
-        pattern[x][y] = 1 - pattern[x][y]  # Flip the cell state                
+        self.display_pattern(result.best_pattern)
+
+    def cycle_boundary(self):
+        """Switches the engine to the next boundary mode, keeping the visible cells."""
+        with self.engine_lock:
+            modes = engine.BOUNDARIES
+            boundary = modes[(modes.index(self.engine.boundary) + 1) % len(modes)]
+            self.engine.set_boundary(boundary)
+        self.log_message(f"Boundary: {boundary} ({self.engine.backend.name} backend)")
+
+    def toggle_recording(self, path=None):
+        """Starts streaming every generation to a file, or stops and saves the current recording."""
+        with self.engine_lock:
+            recorder = self.sim_worker.recorder
+            self.sim_worker.recorder = None
+        if recorder is not None:
+            recorder.close()
+            self.log_message(f"Saved {len(recorder)} generations to {recorder.path}")
+            return
+
+        if path is None:
+            path, _ = QFileDialog.getSaveFileName(self, "Record run", "", "Life recordings (*.liferec)")
+            if not path:
+                return
+        try:
+            with self.engine_lock:
+                recorder = recording.Recorder(path, self.engine.rows, self.engine.cols)
+                recorder.write(self.engine.board)
+                self.sim_worker.recorder = recorder
+        except OSError as error:  # An exception escaping a Qt slot would abort the application
+            self.log_message(f"Could not record to {path}: {error}")
+            return
+        self.log_message(f"Recording to {path}")
+
+    def open_recording(self, path=None):
+        """Opens a recording and shows a slider to scrub through its generations."""
+        if path is None:
+            path, _ = QFileDialog.getOpenFileName(self, "Open recording", "", "Life recordings (*.liferec)")
+            if not path:
+                return
+        self.stop_game()
+        self.close_recording()
+        try:
+            self.recording = recording.Recording(path)
+        except (ValueError, OSError) as error:  # An exception escaping a Qt slot would abort the application
+            self.log_message(f"Could not open {path}: {error}")
+            return
+        self.log_message(f"Opened {path}: {len(self.recording)} generations")
+        self.playback_slider.setRange(0, len(self.recording) - 1)
+        self.playback_slider.setValue(0)
+        self.playback_slider.show()
+        self.show_recorded_generation(0)
+
+    def show_recorded_generation(self, generation):
+        """Displays one generation of the open recording."""
+        if self.recording is not None and len(self.recording):
+            try:
+                self.grid_canvas.set_board(self.recording.frame(generation))
+            except ValueError as error:
+                self.log_message(str(error))
+
+    def close_recording(self):
+        """Leaves playback mode and shows the live board."""
+        if self.recording is None:
+            return
+        self.recording.close()
+        self.recording = None
+        self.playback_slider.hide()
+        self.update_canvas()
+
+    def on_evolution_generation(self, generation, generations, best_fitness):
+        """Logs and plots the best fitness of one evolutionary generation."""
+        self.set_plot_mode("evolution")
+        self.plot_history.append(generation, best_fitness)
+
+        # Log the progress for the current generation; batched by the LogSink, never printed per generation
+        self.log_message(f"Generation {generation}/{generations}: Best Fitness = {best_fitness}")
+
+        # Update plot with the best fitness so far
+        self.redraw_plot()
+
+    def closeEvent(self, event):
+        # Stop the worker threads and fitness worker processes with the window
+        self.simulationStopRequested.emit()
+        self.sim_thread.quit()
+        self.sim_thread.wait()
+        if self.sim_worker.recorder is not None:
+            self.sim_worker.recorder.close()
+        self.close_recording()
+        self.log_sink.flush()
+        if self.evolution_thread is not None:
+            self.evolution_worker.cancel()  # Stops after the generation being scored; its checkpoint is kept
+            self.evolution_thread.quit()
+            self.evolution_thread.wait()
+        if self.fitness_executor is not None:
+            self.fitness_executor.shutdown(cancel_futures=True)
+            self.fitness_executor = None
+        event.accept()
                     
 def main():
+    # --metrics-port PORT serves live metrics for a Prometheus scraper on 127.0.0.1
+    if "--metrics-port" in sys.argv:
+        index = sys.argv.index("--metrics-port")
+        metrics.serve(int(sys.argv[index + 1]))
+        del sys.argv[index:index + 2]
     app = QApplication(sys.argv)
     game = GameOfLife()
     game.show()
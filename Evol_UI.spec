@@ -5,7 +5,7 @@ a = Analysis(
     ['Evol_UI.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[('patterns/*.rle', 'patterns')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
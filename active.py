@@ -0,0 +1,109 @@
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+from rules import CONWAY
+
+DEFAULT_TILE = 32
+
+
+def _tile_view(array, tile, span):
+    """Views ``array`` as a (tile_rows, tile_cols, span, span) grid of windows starting every ``tile`` cells."""
+    s0, s1 = array.strides
+    tile_rows = (array.shape[0] - (span - tile)) // tile
+    tile_cols = (array.shape[1] - (span - tile)) // tile
+    return as_strided(array, shape=(tile_rows, tile_cols, span, span), strides=(tile * s0, tile * s1, s0, s1))
+
+
+def _dilate(mask, wrap=False):
+    """Grows a boolean tile mask by one tile in every direction, wrapping around the edges if asked."""
+    if wrap:
+        grown = mask.copy()
+        for dx, dy in ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)):
+            grown |= np.roll(mask, (dx, dy), axis=(0, 1))
+        return grown
+    padded = np.zeros((mask.shape[0] + 2, mask.shape[1] + 2), dtype=bool)
+    padded[1:-1, 1:-1] = mask
+    grown = np.zeros_like(mask)
+    for dx in range(3):
+        for dy in range(3):
+            grown |= padded[dx:dx + mask.shape[0], dy:dy + mask.shape[1]]
+    return grown
+
+
+class ActiveBoard:
+    """A board that only recomputes tiles whose neighbourhood changed last generation.
+
+    The board is split into ``tile`` x ``tile`` blocks. A cell can only change
+    if something in its 3x3 neighbourhood changed in the previous generation,
+    so after each step the set of changed tiles, grown by one tile, becomes the
+    active set for the next step. Empty areas and settled still lifes cost
+    nothing, and the work per generation tracks activity rather than area.
+    """
+
+    def __init__(self, board, tile=DEFAULT_TILE):
+        board = np.array(board, dtype=np.uint8, ndmin=2)
+        self.rows, self.cols = board.shape
+        self.tile = tile
+        tile_rows, tile_cols = -(-self.rows // tile), -(-self.cols // tile)
+
+        # One dead cell of padding around a board rounded up to whole tiles
+        self._padded = np.zeros((tile_rows * tile + 2, tile_cols * tile + 2), dtype=np.uint8)
+        self._padded[1:self.rows + 1, 1:self.cols + 1] = board != 0
+        self._windows = _tile_view(self._padded, tile, tile + 2)
+        self._tiles = _tile_view(self._padded[1:-1, 1:-1], tile, tile)
+
+        inside = np.zeros(self._padded.shape, dtype=np.uint8)
+        inside[1:self.rows + 1, 1:self.cols + 1] = 1
+        self._inside = _tile_view(inside[1:-1, 1:-1], tile, tile)
+
+        self.active = np.ones((tile_rows, tile_cols), dtype=bool)  # Everything may change at first
+
+    @classmethod
+    def from_array(cls, board):
+        return cls(board)
+
+    def to_array(self):
+        """Returns a copy of the board as a uint8 array."""
+        return self._padded[1:self.rows + 1, 1:self.cols + 1].copy()
+
+    def population(self):
+        return int(self._padded[1:self.rows + 1, 1:self.cols + 1].sum())
+
+    def activity(self):
+        """Returns the fraction of tiles that will be recomputed on the next step."""
+        return float(self.active.mean())
+
+    def _wrap_halo(self):
+        """Copies the opposite edges into the one-cell border so the board behaves as a torus."""
+        rows, cols, padded = self.rows, self.cols, self._padded
+        padded[1:rows + 1, 0] = padded[1:rows + 1, cols]
+        padded[1:rows + 1, cols + 1] = padded[1:rows + 1, 1]
+        padded[0, :cols + 2] = padded[rows, :cols + 2]
+        padded[rows + 1, :cols + 2] = padded[1, :cols + 2]
+
+    def step(self, boundary="dead", rule=CONWAY):
+        """Advances the board by one generation in place and returns it."""
+        if boundary not in ("dead", "torus"):
+            raise ValueError(f"ActiveBoard does not support the '{boundary}' boundary")
+        if not self.active.any():
+            return self  # Nothing changed last generation, so nothing can change now
+        if boundary == "torus":
+            self._wrap_halo()
+
+        windows = self._windows[self.active]  # Copies (k, tile + 2, tile + 2)
+        tile = self.tile
+        counts = np.zeros((windows.shape[0], tile, tile), dtype=np.uint8)
+        for dx in range(3):
+            for dy in range(3):
+                if dx != 1 or dy != 1:
+                    counts += windows[:, dx:dx + tile, dy:dy + tile]
+
+        inside = self._inside[self.active]
+        old = windows[:, 1:-1, 1:-1] & inside  # Ignore wrapped halo cells that fall inside a tile
+        new = rule.apply(old, counts)
+        new &= inside  # Cells past the board edge stay dead
+
+        changed = np.zeros_like(self.active)
+        changed[self.active] = (new != old).any(axis=(1, 2))
+        self._tiles[self.active] = new
+        self.active = _dilate(changed, wrap=boundary == "torus")
+        return self
@@ -0,0 +1,65 @@
+import numpy as np
+from engine import neighbor_counts
+from rules import CONWAY
+
+
+def to_batch(boards):
+    """Stacks a sequence of equally sized boards into one (population, rows, cols) uint8 array."""
+    return np.ascontiguousarray(np.array(boards, dtype=np.uint8, ndmin=3))
+
+
+def random_population(population_size, rows, cols, rng, density=0.5):
+    """Generates a batch of random boards from a numpy Generator."""
+    return (rng.random((population_size, rows, cols)) < density).astype(np.uint8)
+
+
+def step_batch(boards, boundary="dead", rule=CONWAY):
+    """Advances every board in the batch by one generation with dead or wrapped ("torus") edges."""
+    if boundary not in ("dead", "torus"):
+        raise ValueError(f"Batch boards do not support the '{boundary}' boundary")
+    return rule.apply(boards, neighbor_counts(boards, boundary))
+
+
+def run_batch(boards, generations, boundary="dead", rule=CONWAY):
+    """Advances every board in the batch by the given number of generations.
+
+    Stops early once every board in the batch is extinct, a still life or a
+    period-2 oscillator, since the rest of the run can then be read off.
+    """
+    previous = None
+    for generation in range(generations):
+        current = step_batch(boards, boundary, rule)
+        if np.array_equal(current, boards):
+            return current  # Every board is static
+        if previous is not None and np.array_equal(current, previous):
+            # Every board alternates between two states: pick by parity of what is left
+            return current if (generations - generation - 1) % 2 == 0 else boards
+        previous, boards = boards, current
+    return boards
+
+
+def populations(boards):
+    """Returns the number of alive cells on every board in the batch."""
+    return boards.reshape(boards.shape[0], -1).sum(axis=1, dtype=np.int64)
+
+
+def evaluate_batch(boards, generations=10, boundary="dead", rule=CONWAY):
+    """Scores every board by how many cells are alive after the given number of generations."""
+    return populations(run_batch(to_batch(boards), generations, boundary, rule))
+
+
+def crossover_batch(parents1, parents2):
+    """Builds children from the top half of ``parents1`` and the bottom half of ``parents2``."""
+    children = parents2.copy()
+    half = children.shape[1] // 2
+    children[:, :half] = parents1[:, :half]
+    return children
+
+
+def mutate_batch(boards, rng):
+    """Flips one random cell on every board in place."""
+    population_size, rows, cols = boards.shape
+    xs = rng.integers(0, rows, population_size)
+    ys = rng.integers(0, cols, population_size)
+    boards[np.arange(population_size), xs, ys] ^= 1
+    return boards
@@ -0,0 +1,292 @@
+"""Reproducible performance benchmarks for the engines, fitness evaluation and rendering.
+
+Run ``python benchmark.py`` to print a JSON report, ``--output FILE`` to save
+it, and ``--compare BASELINE.json`` to flag results that got slower than a
+previous run (the exit status is 1 if any did). Every board comes from
+``generate_random_pattern`` with a fixed seed, so two runs on the same
+machine measure the same work.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+import numpy as np
+import engine
+import evolution
+import fitness
+from engine import LifeEngine, generate_random_pattern
+
+SEED = 1234
+DEFAULT_SIZES = (20, 256, 1024, 4096)
+QUICK_SIZES = (20, 256)
+DENSITIES = (0.1, 0.3, 0.5)
+SPARSE_BLOCKS = 16  # Random 16x16 soups scattered over an otherwise empty board
+PYTHON_MAX_CELLS = 256 * 256  # The reference loop is far too slow beyond this
+MIN_SECONDS = 0.5  # Each measurement steps for at least this long...
+MAX_GENERATIONS = 1000  # ...or until this many generations
+MEMORY_GENERATIONS = 3
+REGRESSION_THRESHOLD = 0.2
+
+_boards = {}
+
+
+def soup(rows, cols, density, seed=SEED):
+    """Returns a seeded random board, generated once per run."""
+    key = ("soup", rows, cols, density, seed)
+    if key not in _boards:
+        _boards[key] = generate_random_pattern(rows, cols, density, seed)
+    return _boards[key]
+
+
+def sparse_board(rows, cols, seed=SEED):
+    """Returns an empty board with a few seeded 16x16 soups placed at seeded positions."""
+    key = ("sparse", rows, cols, seed)
+    if key not in _boards:
+        board = np.zeros((rows, cols), dtype=np.uint8)
+        rng = np.random.default_rng(seed)
+        block = min(16, rows, cols)
+        for index in range(SPARSE_BLOCKS):
+            x, y = rng.integers(0, rows - block + 1), rng.integers(0, cols - block + 1)
+            board[x:x + block, y:y + block] |= generate_random_pattern(block, block, 0.4, seed + index)
+        _boards[key] = board
+    return _boards[key]
+
+
+def glider_gun(rows, cols):
+    """Returns the library's glider gun centred on an empty board."""
+    import patterns
+
+    cells = patterns.PatternLibrary().load("Glider Gun").cells
+    board = np.zeros((rows, cols), dtype=np.uint8)
+    visible = cells[:rows, :cols]
+    x, y = (rows - visible.shape[0]) // 2, (cols - visible.shape[1]) // 2
+    board[x:x + visible.shape[0], y:y + visible.shape[1]] = visible
+    return board
+
+
+def workloads(size):
+    """Yields (name, board) for every standard workload at a size."""
+    for density in DENSITIES:
+        yield f"soup-{density}", soup(size, size, density)
+    yield "glider-gun", glider_gun(size, size)
+    if size >= 256:
+        yield "sparse", sparse_board(size, size)
+
+
+def measure_steps(board, backend, boundary="dead", min_seconds=MIN_SECONDS, max_generations=MAX_GENERATIONS):
+    """Steps a board until ``min_seconds`` have passed and returns throughput and peak memory."""
+    life = LifeEngine(board=board, backend=backend, boundary=boundary)
+    generations = 0
+    start = time.perf_counter()
+    while generations < max_generations:
+        life.advance()  # Only the backend's own step is timed; reading ``board`` would add an unpack
+        generations += 1
+        if time.perf_counter() - start >= min_seconds:
+            break
+    seconds = time.perf_counter() - start
+
+    # Memory is traced in a separate short run so tracing does not slow the timed one
+    tracemalloc.start()
+    life = LifeEngine(board=board, backend=backend, boundary=boundary)
+    life.run(MEMORY_GENERATIONS)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    rows, cols = board.shape
+    return {
+        "generations": generations,
+        "seconds": seconds,
+        "gens_per_sec": generations / seconds,
+        "cells_per_sec": generations * rows * cols / seconds,
+        "peak_bytes": peak,
+    }
+
+
+def bench_steps(sizes, backends):
+    results = []
+    for size in sizes:
+        for workload, board in workloads(size):
+            for backend in backends:
+                if backend == "python" and size * size > PYTHON_MAX_CELLS:
+                    continue
+                boundary = "infinite" if backend == "sparse" else "dead"
+                result = {"group": "step", "name": f"{backend}/{workload}/{size}x{size}",
+                          "backend": backend, "workload": workload, "rows": size, "cols": size}
+                result.update(measure_steps(board, backend, boundary))
+                results.append(result)
+                _progress(result)
+    return results
+
+
+def bench_fitness(backends, population_size=64, size=20, generations=10):
+    """Times scoring one population per backend, without a cache or worker processes."""
+    population = [soup(size, size, 0.5, SEED + index) for index in range(population_size)]
+    results = []
+    for backend in backends:
+        start = time.perf_counter()
+        fitness.evaluate_population(population, generations, backend)
+        seconds = time.perf_counter() - start
+        result = {"group": "fitness", "name": f"{backend}/population-{population_size}/{size}x{size}",
+                  "backend": backend, "rows": size, "cols": size, "seconds": seconds,
+                  "patterns_per_sec": population_size / seconds}
+        results.append(result)
+        _progress(result)
+    return results
+
+
+def bench_evolution(backends, size=20, generations=10, population_size=20):
+    """Times a seeded evolutionary run with ``evolve`` on each backend and with ``evolve_batch``."""
+    import random
+
+    runs = [
+        (f"evolve/{backend}", backend, lambda backend=backend: evolution.evolve(
+            size, size, generations, population_size, backend=backend, rng=random.Random(SEED)))
+        for backend in backends
+    ]
+    runs.append(("evolve_batch", None, lambda: evolution.evolve_batch(size, size, generations, population_size, seed=SEED)))
+    results = []
+    for name, backend, run in runs:
+        tracemalloc.start()
+        start = time.perf_counter()
+        outcome = run()
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        result = {"group": "evolution", "name": f"{name}/{size}x{size}", "backend": backend, "rows": size, "cols": size,
+                  "seconds": seconds, "peak_bytes": peak, "best_fitness": int(outcome.best_fitness)}
+        results.append(result)
+        _progress(result)
+    return results
+
+
+def bench_rendering(sizes, frames=50):
+    """Times pushing generations into the GridCanvas and painting them offscreen."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PyQt5.QtGui import QImage
+        from PyQt5.QtWidgets import QApplication
+        from grid_canvas import GridCanvas
+    except ImportError:
+        return []
+
+    app = QApplication.instance() or QApplication([])
+    canvas = GridCanvas()
+    canvas.resize(800, 800)
+    target = QImage(canvas.size(), QImage.Format_RGB32)
+    results = []
+    for size in sizes:
+        life = LifeEngine(board=soup(size, size, 0.3))
+        boards = []
+        for _ in range(frames):
+            life.step()
+            boards.append(life.board.copy())
+        canvas.set_board(np.zeros((size, size), dtype=np.uint8))
+        start = time.perf_counter()
+        for board in boards:
+            canvas.set_board(board)
+            canvas.render(target)
+            app.processEvents()
+        seconds = time.perf_counter() - start
+        result = {"group": "render", "name": f"canvas/{size}x{size}", "rows": size, "cols": size,
+                  "frames": frames, "seconds": seconds, "frames_per_sec": frames / seconds}
+        results.append(result)
+        _progress(result)
+    return results
+
+
+def _progress(result):
+    rate = next((result[key] for key in ("gens_per_sec", "patterns_per_sec", "frames_per_sec") if key in result), None)
+    detail = f"{rate:,.1f}/s" if rate is not None else f"{result['seconds']:.3f}s"
+    print(f"{result['group']:>9} {result['name']:<40} {detail}", file=sys.stderr)
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes=DEFAULT_SIZES, backends=None, groups=("step", "fitness", "evolution", "render")):
+    """Runs the selected benchmark groups and returns the JSON-serialisable report."""
+    backends = list(backends or engine.BACKENDS)
+    results = []
+    if "step" in groups:
+        results += bench_steps(sizes, backends)
+    if "fitness" in groups:
+        results += bench_fitness([backend for backend in backends if backend != "sparse"])
+    if "evolution" in groups:
+        results += bench_evolution([backend for backend in backends if backend != "sparse"])
+    if "render" in groups:
+        results += bench_rendering([size for size in sizes if size <= 1024])
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "seed": SEED,
+        },
+        "results": results,
+    }
+
+
+def _cost(result):
+    """Seconds per unit of work, so larger is slower for every group."""
+    for key in ("gens_per_sec", "patterns_per_sec", "frames_per_sec"):
+        if key in result:
+            return 1.0 / result[key]
+    return result["seconds"]
+
+
+def compare(report, baseline, threshold=REGRESSION_THRESHOLD):
+    """Returns (name, baseline cost, new cost) for results more than ``threshold`` slower than the baseline."""
+    previous = {(result["group"], result["name"]): result for result in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        old = previous.get((result["group"], result["name"]))
+        if old is not None and _cost(result) > _cost(old) * (1 + threshold):
+            regressions.append((f"{result['group']}/{result['name']}", _cost(old), _cost(result)))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", help=f"square board sizes (default {DEFAULT_SIZES})")
+    parser.add_argument("--quick", action="store_true", help=f"only sizes {QUICK_SIZES}")
+    parser.add_argument("--backends", nargs="+", choices=sorted(engine.BACKENDS), help="backends to measure (default all)")
+    parser.add_argument("--groups", nargs="+", choices=("step", "fitness", "evolution", "render"),
+                        default=("step", "fitness", "evolution", "render"))
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON report of an earlier run to check for regressions")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="relative slowdown counted as a regression (default %(default)s)")
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or (QUICK_SIZES if args.quick else DEFAULT_SIZES)
+    report = run(sizes, args.backends, args.groups)
+    text = json.dumps(report, indent=1)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as stream:
+            stream.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as stream:
+            regressions = compare(report, json.load(stream), args.threshold)
+        for name, old, new in regressions:
+            print(f"REGRESSION {name}: {old * 1000:.3f} ms -> {new * 1000:.3f} ms per unit", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
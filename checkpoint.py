@@ -0,0 +1,145 @@
+import json
+import os
+import tempfile
+import threading
+import numpy as np
+
+VERSION = 1
+
+
+class Checkpoint:
+    """The complete state of an evolutionary run at the start of one generation.
+
+    ``population`` is a (population, rows, cols) uint8 array, stored
+    bit-packed on disk. ``rng_state`` is the ``random.Random.getstate()``
+    tuple for ``evolve`` or the NumPy ``bit_generator.state`` dict for
+    ``evolve_batch``. Restoring all of it continues a run exactly as if it
+    had never stopped.
+    """
+
+    def __init__(self, kind, generation, population, scores, fitness_history, rng_state, params):
+        self.kind = kind
+        self.generation = generation
+        self.population = population
+        self.scores = scores
+        self.fitness_history = fitness_history
+        self.rng_state = rng_state
+        self.params = params
+
+    def check(self, kind, **params):
+        """Raises ValueError if the checkpoint was written by a different kind of run."""
+        if kind != self.kind:
+            raise ValueError(f"Checkpoint is from {self.kind}, not {kind}")
+        for name, value in params.items():
+            if self.params.get(name) != value:
+                raise ValueError(f"Checkpoint has {name}={self.params.get(name)!r}, the run has {value!r}")
+
+
+def _encode_rng_state(state):
+    if isinstance(state, tuple):  # random.Random: (version, internal state, gauss_next)
+        return {"random": [state[0], list(state[1]), state[2]]}
+    return {"numpy": state}
+
+
+def _decode_rng_state(state):
+    if "random" in state:
+        version, internal, gauss_next = state["random"]
+        return version, tuple(internal), gauss_next
+    return state["numpy"]
+
+
+def save_checkpoint(path, checkpoint):
+    """Writes a checkpoint atomically: a crash mid-write leaves the previous file intact."""
+    population = np.asarray(checkpoint.population, dtype=np.uint8)
+    count, rows, cols = population.shape
+    meta = {
+        "version": VERSION,
+        "kind": checkpoint.kind,
+        "generation": checkpoint.generation,
+        "shape": [count, rows, cols],
+        "rng_state": _encode_rng_state(checkpoint.rng_state),
+        "params": checkpoint.params,
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temporary = tempfile.mkstemp(prefix=".checkpoint-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(handle, "wb") as stream:
+            np.savez(
+                stream,
+                meta=np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8),
+                population=np.packbits(population.reshape(count, -1), axis=1),
+                scores=np.asarray(checkpoint.scores),  # Integer or float, depending on the objective
+                fitness_history=np.asarray(checkpoint.fitness_history),
+            )
+            stream.flush()
+            os.fsync(stream.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def load_checkpoint(path):
+    """Reads a checkpoint written by ``save_checkpoint``."""
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(data["meta"].tobytes().decode("utf-8"))
+        if meta.get("version") != VERSION:
+            raise ValueError(f"Unsupported checkpoint version {meta.get('version')}")
+        count, rows, cols = meta["shape"]
+        population = np.unpackbits(data["population"], axis=1, count=rows * cols).reshape(count, rows, cols)
+        return Checkpoint(meta["kind"], meta["generation"], population, data["scores"].tolist(),
+                          data["fitness_history"].tolist(), _decode_rng_state(meta["rng_state"]), meta["params"])
+
+
+class CheckpointWriter:
+    """Saves checkpoints from a background thread so the run never waits on the disk.
+
+    Only the newest checkpoint matters: if the run produces another before
+    the previous one is written, the pending one is replaced rather than
+    queued. ``close`` writes whatever is still pending.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._condition = threading.Condition()
+        self._pending = None
+        self._closed = False
+        self.error = None
+        self._thread = threading.Thread(target=self._run, name="checkpoint-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, checkpoint):
+        with self._condition:
+            if self.error is not None:
+                raise self.error
+            self._pending = checkpoint
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                checkpoint, self._pending = self._pending, None
+                if checkpoint is None:
+                    return
+            try:
+                save_checkpoint(self.path, checkpoint)
+            except Exception as error:  # Reported to the run on its next write or close
+                with self._condition:
+                    self.error = error
+
+    def close(self):
+        """Writes the pending checkpoint, if any, and stops the thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,221 @@
+"""Headless command-line runner for evolutionary searches and simulation sweeps.
+
+Examples::
+
+    python cli.py evolve --rows 32 --cols 32 --runs 100 --seed 1 --workers 8 --output runs.jsonl
+    python cli.py simulate --rule B3/S23 B36/S23 --count 1000 --steps 5000
+
+Every record is written as one JSON object per line as soon as it is
+available, so output can be piped or tailed while a sweep runs. This path
+never imports PyQt5 or matplotlib.
+"""
+import argparse
+import io
+import json
+import os
+import random
+import sys
+import time
+import engine
+import evolution
+import fitness
+import objectives
+import patterns
+from rules import get_rule
+
+
+class JsonLines:
+    """Writes one JSON object per line to a path or stdout, flushing each record."""
+
+    def __init__(self, path="-"):
+        self.stream = sys.stdout if path in (None, "-") else open(path, "a", encoding="utf-8")
+
+    def write(self, record):
+        self.stream.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self.stream.flush()
+
+    def close(self):
+        if self.stream is not sys.stdout:
+            self.stream.close()
+
+
+def pattern_rle(board, name="best", rule="B3/S23"):
+    """Encodes a board as an RLE string."""
+    text = io.StringIO()
+    patterns.write_rle(patterns.Pattern(name, engine.to_array(board), str(rule)), text)
+    return text.getvalue()
+
+
+def _number(value):
+    """Converts a NumPy score to the equivalent Python int or float for JSON."""
+    return value.item() if hasattr(value, "item") else value
+
+
+def run_evolve(args, out):
+    workers = args.workers or os.cpu_count() or 1
+    executor = fitness.make_executor(workers) if not args.batch else None
+    cache = fitness.FitnessCache(symmetric=True) if args.cache else None
+    rule = str(get_rule(args.rule))
+    objective = objectives.objective_key(args.objective)
+    try:
+        for run in range(args.runs):
+            seed = args.seed + run
+            start = time.perf_counter()
+
+            def on_generation(generation, generations, best_fitness):
+                if args.progress:
+                    out.write({"type": "generation", "run": run, "seed": seed, "generation": generation,
+                               "best_fitness": _number(best_fitness)})
+
+            options = dict(rows=args.rows, cols=args.cols, generations=args.generations,
+                           population_size=args.population, fitness_generations=args.fitness_generations,
+                           on_generation=on_generation, boundary=args.boundary, rule=rule,
+                           checkpoint=args.checkpoint.format(run=run) if args.checkpoint else None,
+                           checkpoint_every=args.checkpoint_every, resume=args.resume)
+            if args.batch:
+                result = evolution.evolve_batch(seed=seed, **options)
+            else:
+                result = evolution.evolve(backend=args.backend, executor=executor, workers=workers, cache=cache,
+                                          rng=random.Random(seed), objective=args.objective, **options)
+            record = {
+                "type": "result", "run": run, "seed": seed, "rows": args.rows, "cols": args.cols,
+                "rule": rule, "boundary": args.boundary, "population": args.population,
+                "generations": args.generations, "objective": objective,
+                "best_fitness": _number(result.best_fitness),
+                "fitness_history": [_number(value) for value in result.fitness_history],
+                "pattern": pattern_rle(result.best_pattern, f"run-{run}", rule),
+                "seconds": round(time.perf_counter() - start, 6),
+            }
+            if cache is not None:
+                record["cache"] = cache.stats()
+            out.write(record)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def simulate_one(task):
+    """Runs one seeded soup for ``steps`` generations or until it cycles; runs inside worker processes."""
+    rule, seed, rows, cols, density, steps, boundary, backend = task
+    board = engine.generate_random_pattern(rows, cols, density, seed)
+    life = engine.LifeEngine(board=board, backend=backend, boundary=boundary, rule=rule)
+    initial = life.population()
+    start = time.perf_counter()
+    cycle = life.find_cycle(steps)  # Stops at the first repeated generation
+    record = {
+        "type": "simulation", "rule": rule, "seed": seed, "rows": rows, "cols": cols, "density": density,
+        "boundary": boundary, "initial_population": initial, "generation": life.generation,
+        "population": life.population(), "seconds": round(time.perf_counter() - start, 6),
+    }
+    if cycle is not None:
+        record.update(cycle_start=cycle.start, period=cycle.period, extinct=cycle.extinct)
+    return record
+
+
+def run_simulate(args, out):
+    rules = [str(get_rule(rule)) for rule in args.rule]
+    tasks = [(rule, args.seed + index, args.rows, args.cols, args.density, args.steps, args.boundary, args.backend)
+             for rule in rules for index in range(args.count)]
+    executor = fitness.make_executor(args.workers)
+    try:
+        if executor is None:
+            records = map(simulate_one, tasks)
+        else:
+            workers = args.workers or os.cpu_count() or 1
+            records = executor.map(simulate_one, tasks, chunksize=max(1, len(tasks) // workers // 4))
+        for record in records:
+            out.write(record)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--rows", type=int, default=20, help="board rows (default %(default)s)")
+    common.add_argument("--cols", type=int, default=20, help="board columns (default %(default)s)")
+    common.add_argument("--boundary", choices=engine.BOUNDARIES, default=engine.DEFAULT_BOUNDARY)
+    common.add_argument("--backend", choices=sorted(engine.BACKENDS), help="step implementation (default numpy)")
+    common.add_argument("--seed", type=int, default=0, help="seed of the first run; run i uses seed + i")
+    common.add_argument("--workers", type=int, default=1, help="worker processes (default %(default)s, 0 = one per CPU)")
+    common.add_argument("--output", default="-", help="JSON-lines file to append to (default stdout)")
+
+    evolve = subcommands.add_parser("evolve", parents=[common], help="run evolutionary searches")
+    evolve.add_argument("--rule", default="B3/S23", help="Life-like rulestring (default %(default)s)")
+    evolve.add_argument("--runs", type=int, default=1, help="independent searches (default %(default)s)")
+    evolve.add_argument("--population", type=int, default=20, help="population size (default %(default)s)")
+    evolve.add_argument("--generations", type=int, default=10, help="evolutionary generations (default %(default)s)")
+    evolve.add_argument("--fitness-generations", type=int, default=10,
+                        help="simulated generations per fitness evaluation (default %(default)s)")
+    evolve.add_argument("--objective", default=objectives.DEFAULT_OBJECTIVE,
+                        help="fitness objective, or weighted objectives such as longevity=1,gliders=10 "
+                             f"(one of {', '.join(sorted(objectives.OBJECTIVES))}; default %(default)s)")
+    evolve.add_argument("--batch", action="store_true", help="use the vectorized evolve_batch (ignores --workers)")
+    evolve.add_argument("--cache", action="store_true", help="reuse scores of boards seen before")
+    evolve.add_argument("--progress", action="store_true", help="also emit a record per generation")
+    evolve.add_argument("--checkpoint", metavar="PATH",
+                        help="save the run state here; with --runs > 1 it must contain {run}")
+    evolve.add_argument("--checkpoint-every", type=int, default=10, help="generations between checkpoints (default %(default)s)")
+    evolve.add_argument("--resume", action="store_true", help="continue from existing checkpoints")
+
+    simulate = subcommands.add_parser("simulate", parents=[common], help="run seeded random soups")
+    simulate.add_argument("--rule", nargs="+", default=["B3/S23"], help="one or more rulestrings to sweep")
+    simulate.add_argument("--count", type=int, default=100, help="soups per rule (default %(default)s)")
+    simulate.add_argument("--density", type=float, default=0.5, help="initial density (default %(default)s)")
+    simulate.add_argument("--steps", type=int, default=1000, help="maximum generations (default %(default)s)")
+    return parser
+
+
+def check_args(parser, args):
+    """Reports invalid option combinations through ``parser.error`` before any work starts."""
+    minimums = {"rows": 1, "cols": 1, "workers": 0}
+    if args.command == "evolve":
+        # Selection keeps half the population and crossover needs two distinct survivors
+        minimums.update(population=4, runs=0, generations=0, fitness_generations=0, checkpoint_every=1)
+    else:
+        minimums.update(count=0, steps=0)
+    for name, minimum in minimums.items():
+        if getattr(args, name) < minimum:
+            parser.error(f"--{name.replace('_', '-')} must be at least {minimum}")
+    if args.command == "simulate" and not 0 <= args.density <= 1:
+        parser.error("--density must be between 0 and 1")
+
+    rules = args.rule if args.command == "simulate" else [args.rule]
+    try:
+        for rule in rules:  # Checks the rulestring, backend and boundary together
+            engine.LifeEngine(1, 1, backend=args.backend, boundary=args.boundary, rule=rule)
+        objective = objectives.objective_key(args.objective) if args.command == "evolve" else None
+    except ValueError as error:
+        parser.error(str(error))
+    if args.command != "evolve":
+        return
+    if args.checkpoint and args.runs > 1 and "{run}" not in args.checkpoint:
+        parser.error("--checkpoint must contain {run} when --runs is more than 1")
+    if args.batch and objective != objectives.objective_key():
+        parser.error("--batch only supports the population objective")
+    if args.batch and args.boundary == "infinite":
+        parser.error("--batch only supports the dead and torus boundaries")
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    check_args(parser, args)
+    out = JsonLines(args.output)
+    try:
+        if args.command == "evolve":
+            run_evolve(args, out)
+        else:
+            run_simulate(args, out)
+    except BrokenPipeError:
+        pass  # The reader went away (e.g. piped into head)
+    finally:
+        out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
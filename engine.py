@@ -0,0 +1,394 @@
+import hashlib
+import random
+from collections import deque
+import numpy as np
+from active import ActiveBoard
+from bitboard import BitBoard
+from rules import CONWAY, get_rule
+from sparse import SparseBoard
+
+# Offsets of the eight cells surrounding (x, y)
+NEIGHBORS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+# What lies past the board edge: dead cells, the opposite edge, or more (unbounded) board
+BOUNDARIES = ("dead", "torus", "infinite")
+DEFAULT_BOUNDARY = "dead"
+
+# Number of recent board hashes kept when looking for cycles
+DEFAULT_CYCLE_HISTORY = 64
+
+
+def to_array(grid):
+    """Converts a list-of-lists grid (or any 2-D sequence) into a compact uint8 array."""
+    return np.array(grid, dtype=np.uint8, ndmin=2)
+
+
+def to_list(board):
+    """Converts a uint8 board back into the list-of-lists format used by the UI."""
+    return np.asarray(board, dtype=np.uint8).tolist()
+
+
+def generate_random_pattern(rows, cols, density=0.5, seed=None):
+    """Generates a random uint8 board; a fixed seed always gives the same board."""
+    rng = random.Random(seed)
+    return to_array([[1 if rng.random() < density else 0 for _ in range(cols)] for _ in range(rows)])
+
+
+def count_alive_neighbors(board, x, y, boundary=DEFAULT_BOUNDARY):
+    """Counts the number of alive neighbors of a given cell (x, y)."""
+    rows, cols = board.shape
+    count = 0
+    for dx, dy in NEIGHBORS:
+        nx, ny = x + dx, y + dy
+        if boundary == "torus":  # Wrap around to the opposite edge
+            count += board[nx % rows, ny % cols]
+        elif 0 <= nx < rows and 0 <= ny < cols:  # Cells outside the board count as dead
+            count += board[nx, ny]
+    return int(count)
+
+
+def _check_boundary(boundary, supported=("dead", "torus")):
+    if boundary not in supported:
+        raise ValueError(f"Unsupported boundary '{boundary}', expected one of: {', '.join(supported)}")
+
+
+def step_python(board, boundary=DEFAULT_BOUNDARY, rule=CONWAY):
+    """Returns the next generation of a board under a Life-like rule, one cell at a time."""
+    _check_boundary(boundary)
+    table = rule.table.tolist()
+    rows, cols = board.shape
+    new_board = np.zeros_like(board)
+    for x in range(rows):
+        for y in range(cols):
+            alive_neighbors = count_alive_neighbors(board, x, y, boundary)
+            new_board[x, y] = table[board[x, y]][alive_neighbors]  # Survival row for alive cells, birth row for dead
+    return new_board
+
+
+def neighbor_counts(board, boundary=DEFAULT_BOUNDARY):
+    """Returns the alive-neighbour count of every cell at once.
+
+    Leading axes are treated as independent boards, so a (population, rows,
+    cols) batch is counted in the same call.
+    """
+    _check_boundary(boundary)
+    rows, cols = board.shape[-2:]
+    if boundary == "torus":
+        padded = np.pad(board, [(0, 0)] * (board.ndim - 2) + [(1, 1), (1, 1)], mode="wrap")
+    else:
+        padded = np.zeros(board.shape[:-2] + (rows + 2, cols + 2), dtype=np.uint8)
+        padded[..., 1:-1, 1:-1] = board
+    counts = np.zeros(board.shape, dtype=np.uint8)
+    for dx, dy in NEIGHBORS:
+        counts += padded[..., 1 + dx:rows + 1 + dx, 1 + dy:cols + 1 + dy]
+    return counts
+
+
+def step_numpy(board, boundary=DEFAULT_BOUNDARY, rule=CONWAY):
+    """Returns the next generation of a board under a Life-like rule, vectorized over all cells."""
+    return rule.apply(board, neighbor_counts(board, boundary))
+
+
+def _identity(board):
+    return board
+
+
+def _population(board):
+    return int(board.sum())
+
+
+def board_digest(data):
+    """Returns a 128-bit hash of a board's bytes, used to recognise repeated generations."""
+    return hashlib.blake2b(np.ascontiguousarray(data).tobytes(), digest_size=16).digest()
+
+
+def _check_rule(rule, boundary):
+    if boundary == "infinite" and rule.births_from_nothing:
+        raise ValueError(f"Rule {rule} brings empty cells to life and cannot run on the infinite boundary")
+    return rule
+
+
+class Backend:
+    """A step implementation plus the conversions to and from its native board format.
+
+    ``step(state, boundary, rule)`` returns the next state. ``edit(state, board)``
+    writes an edited uint8 board back; it defaults to repacking, which is
+    only wrong for backends whose state extends past the board (``sparse``).
+    """
+
+    def __init__(self, name, step, pack=_identity, unpack=_identity, population=None, digest=None,
+                 boundaries=("dead", "torus"), edit=None):
+        self.name = name
+        self.step = step
+        self.pack = pack
+        self.unpack = unpack
+        self.population = population or (lambda state: _population(unpack(state)))
+        self.digest = digest or (lambda state: board_digest(unpack(state)))
+        self.boundaries = boundaries
+        self.edit = edit or (lambda state, board: pack(board))
+
+
+BACKENDS = {}
+DEFAULT_BACKEND = "numpy"
+DEFAULT_INFINITE_BACKEND = "sparse"
+
+
+def register_backend(name, step, pack=_identity, unpack=_identity, population=None, digest=None,
+                     boundaries=("dead", "torus"), edit=None):
+    """Makes a step implementation selectable by name."""
+    BACKENDS[name] = Backend(name, step, pack, unpack, population, digest, boundaries, edit)
+    return BACKENDS[name]
+
+
+def get_backend(name=None, boundary=DEFAULT_BOUNDARY):
+    """Looks up a registered backend, falling back to the default one for the boundary mode."""
+    if boundary not in BOUNDARIES:
+        raise ValueError(f"Unknown boundary '{boundary}', expected one of: {', '.join(BOUNDARIES)}")
+    name = name or (DEFAULT_INFINITE_BACKEND if boundary == "infinite" else DEFAULT_BACKEND)
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend '{name}', expected one of: {', '.join(sorted(BACKENDS))}")
+    backend = BACKENDS[name]
+    if boundary not in backend.boundaries:
+        raise ValueError(f"Backend '{name}' does not support the '{boundary}' boundary")
+    return backend
+
+
+register_backend("python", step_python)
+register_backend("numpy", step_numpy)
+register_backend("bitpacked", BitBoard.step, BitBoard.from_array, BitBoard.to_array, BitBoard.population,
+                 lambda state: board_digest(state.words))
+register_backend("active", ActiveBoard.step, ActiveBoard.from_array, ActiveBoard.to_array, ActiveBoard.population)
+register_backend("sparse", SparseBoard.step, SparseBoard.from_array, SparseBoard.to_array, SparseBoard.population,
+                 SparseBoard.digest, boundaries=("infinite",), edit=lambda state, board: state.paste(board))
+
+
+class Cycle:
+    """A repeating sequence of generations found while running an engine.
+
+    The board at generation ``start`` reappears every ``period`` generations.
+    A still life has period 1; an extinct board is a still life with no
+    alive cells.
+    """
+
+    def __init__(self, start, period, population):
+        self.start = start
+        self.period = period
+        self.extinct = population == 0
+
+    def __repr__(self):
+        return f"Cycle(start={self.start}, period={self.period}, extinct={self.extinct})"
+
+
+def step(board, backend=None, boundary=DEFAULT_BOUNDARY, rule=None):
+    """Returns the next generation of a uint8 board using the selected backend."""
+    backend = get_backend(backend, boundary)
+    return backend.unpack(backend.step(backend.pack(to_array(board)), boundary, get_rule(rule)))
+
+
+class LifeEngine:
+    """Headless Game of Life simulation over a compact uint8 board.
+
+    The engine has no Qt or matplotlib dependency, so it can be driven from
+    scripts and servers; the UI only observes ``board`` after each step.
+    Boards are held in the native format of the selected backend and only
+    unpacked to uint8 when ``board`` is read.
+
+    ``boundary`` picks what lies past the edges: dead cells, the opposite
+    edge (``"torus"``), or more board (``"infinite"``, where ``board`` is the
+    rows x cols window at the origin of an unbounded sparse plane).
+    ``rule`` is a Life-like rulestring such as ``"B36/S23"`` (default B3/S23).
+    """
+
+    def __init__(self, rows=20, cols=20, board=None, backend=None, boundary=DEFAULT_BOUNDARY, rule=None):
+        if board is None:
+            board = np.zeros((rows, cols), dtype=np.uint8)
+        board = to_array(board)
+        self.shape = board.shape
+        self.boundary = boundary
+        self.backend = get_backend(backend, boundary)
+        self.rule = _check_rule(get_rule(rule), boundary)
+        self._state = self.backend.pack(board.copy())
+        self._board = None
+        self.generation = 0
+        self.cycle = None  # Last cycle found by run(..., detect_cycles=True)
+
+    @property
+    def rows(self):
+        return self.shape[0]
+
+    @property
+    def cols(self):
+        return self.shape[1]
+
+    @property
+    def board(self):
+        """The current generation as a uint8 array."""
+        if self._board is None:
+            self._board = self.backend.unpack(self._state)
+        return self._board
+
+    def _store(self, board, edit=False):
+        if edit:
+            self._state = self.backend.edit(self._state, board)
+        else:
+            self._state = self.backend.pack(board)
+        self._board = None
+
+    def set_backend(self, name):
+        """Switches the step implementation, keeping the current board."""
+        board = self.board.copy()
+        self.backend = get_backend(name, self.boundary)
+        self._store(board)
+
+    def set_boundary(self, boundary):
+        """Switches the boundary mode, keeping the visible board.
+
+        The backend is kept if it supports the new mode, otherwise the
+        default backend for that mode is used. Leaving ``"infinite"`` drops
+        everything outside the visible window.
+        """
+        board = self.board.copy()
+        backend = get_backend(self.backend.name if boundary in self.backend.boundaries else None, boundary)
+        rule = _check_rule(self.rule, boundary)  # Checked before anything is changed
+        self.backend, self.rule, self.boundary = backend, rule, boundary
+        self._store(board)
+
+    def set_rule(self, rule):
+        """Switches to another Life-like rule, given as a rulestring or Rule."""
+        self.rule = _check_rule(get_rule(rule), self.boundary)
+        self.cycle = None
+
+    def load(self, board):
+        """Replaces the current board and resets the generation counter."""
+        board = to_array(board)
+        if board.shape != self.shape:
+            raise ValueError(f"Expected a {self.rows}x{self.cols} board, got {board.shape[0]}x{board.shape[1]}")
+        self._store(board.copy())
+        self.generation = 0
+
+    def clear(self):
+        """Kills every cell on the board."""
+        self._store(np.zeros(self.shape, dtype=np.uint8))
+        self.generation = 0
+
+    def set_cell(self, x, y, value):
+        """Sets a single cell to alive (1) or dead (0)."""
+        board = self.board
+        board[x, y] = value
+        self._store(board, edit=True)
+
+    def add_cells(self, cells, x=0, y=0):
+        """Adds a pattern's live cells with its top-left corner at (x, y).
+
+        Anything past the board edge is dropped; returns False if the pattern
+        had to be clipped.
+        """
+        cells = to_array(cells)
+        board = self.board
+        visible = cells[:max(0, self.rows - x), :max(0, self.cols - y)]
+        board[x:x + visible.shape[0], y:y + visible.shape[1]] |= visible
+        self._store(board, edit=True)
+        return not cells[visible.shape[0]:].any() and not cells[:, visible.shape[1]:].any()
+
+    def toggle(self, x, y):
+        """Switches a single cell between alive (1) and dead (0)."""
+        self.set_cell(x, y, 1 - self.board[x, y])
+
+    def population(self):
+        """Returns the number of alive cells on the board."""
+        return self.backend.population(self._state)
+
+    def digest(self):
+        """Returns a hash of the current generation in the backend's native format."""
+        return self.backend.digest(self._state)
+
+    def bounding_box(self):
+        """Returns (min_x, min_y, max_x, max_y) of the live cells, or None if there are none.
+
+        On the infinite boundary this covers the whole plane, not just ``board``.
+        """
+        if self.boundary == "infinite":
+            return self._state.bounding_box()
+        board = self.board
+        rows, cols = np.flatnonzero(board.any(axis=1)), np.flatnonzero(board.any(axis=0))
+        if not len(rows):
+            return None
+        return int(rows[0]), int(cols[0]), int(rows[-1]), int(cols[-1])
+
+    def live_cells(self):
+        """Returns the live cells cropped to their bounding box as a uint8 array (empty if there are none)."""
+        box = self.bounding_box()
+        if box is None:
+            return np.zeros((0, 0), dtype=np.uint8)
+        x0, y0, x1, y1 = box
+        if self.boundary == "infinite":
+            return self._state.to_array(x0, y0, x1 - x0 + 1, y1 - y0 + 1)
+        return self.board[x0:x1 + 1, y0:y1 + 1]
+
+    def advance(self):
+        """Advances the board by one generation without unpacking it."""
+        self._state = self.backend.step(self._state, self.boundary, self.rule)
+        self._board = None
+        self.generation += 1
+
+    def step(self):
+        """Advances the board by one generation."""
+        self.advance()
+        return self.board
+
+    def run(self, generations, detect_cycles=False, history=DEFAULT_CYCLE_HISTORY):
+        """Advances the board by the given number of generations.
+
+        With ``detect_cycles`` the engine hashes every generation and stops
+        simulating as soon as a board repeats one of the last ``history``
+        boards; the remaining generations are skipped by whole periods, so
+        the result is the same as running them all. The cycle is stored in
+        ``self.cycle``.
+        """
+        target = self.generation + generations
+        if detect_cycles:
+            self.cycle = self.find_cycle(generations, history)
+            if self.cycle is not None:
+                remaining = target - self.generation
+                self.generation = target - remaining % self.cycle.period  # Skip whole periods
+        for _ in range(target - self.generation):
+            self._state = self.backend.step(self._state, self.boundary, self.rule)
+        self._board = None
+        self.generation = target
+        return self.board
+
+    def find_cycle(self, max_generations, history=DEFAULT_CYCLE_HISTORY):
+        """Advances until the board repeats a recent generation, or for at most ``max_generations``.
+
+        Returns the ``Cycle`` found, or None if no repeat was seen. Only the
+        last ``history`` board hashes are remembered, so periods longer than
+        that go unnoticed.
+        """
+        seen = {self.backend.digest(self._state): self.generation}
+        order = deque(seen)
+        for _ in range(max_generations):
+            self.advance()
+            digest = self.backend.digest(self._state)
+            if digest in seen:
+                start = seen[digest]
+                return Cycle(start, self.generation - start, self.population())
+            seen[digest] = self.generation
+            order.append(digest)
+            if len(order) > history:
+                del seen[order.popleft()]
+        return None
+
+
+def evaluate_fitness(pattern, generations=10, backend=None, boundary=DEFAULT_BOUNDARY, rule=None, objective=None):
+    """Scores a pattern by how many cells are alive after the given number of generations.
+
+    Any other ``objective`` (see ``objectives.parse_objective``) is scored
+    by ``objectives.score`` in a single simulation of the pattern.
+    """
+    if objective not in (None, "population"):
+        import objectives  # Imported here because objectives builds on this module
+
+        return objectives.score(pattern, generations, objective, backend, boundary, rule)
+    engine = LifeEngine(board=pattern, backend=backend, boundary=boundary, rule=rule)
+    engine.run(generations, detect_cycles=True)  # Dead, static and oscillating boards stop early
+    return engine.population()
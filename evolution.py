@@ -0,0 +1,203 @@
+import os
+import random
+import numpy as np
+import batch
+import engine
+import metrics
+from checkpoint import Checkpoint, CheckpointWriter, load_checkpoint
+from fitness import evaluate_population
+from objectives import objective_key
+from rules import get_rule
+
+
+class EvolutionResult:
+    """Outcome of an evolutionary search."""
+
+    def __init__(self, best_pattern, best_fitness, fitness_history):
+        self.best_pattern = best_pattern
+        self.best_fitness = best_fitness
+        self.fitness_history = fitness_history
+
+
+def random_pattern(rows, cols, rng=random):
+    """Generates a random starting pattern from the given random number generator."""
+    return engine.generate_random_pattern(rows, cols, seed=rng.getrandbits(64))
+
+
+def crossover(parent1, parent2):
+    """Performs crossover between two patterns: top half of one parent, bottom half of the other."""
+    child = engine.to_array(parent2).copy()
+    half = child.shape[0] // 2
+    child[:half] = engine.to_array(parent1)[:half]
+    return child
+
+
+def mutate(pattern, rng=random):
+    """Mutates the given pattern in place by flipping a random cell."""
+    x = rng.randint(0, pattern.shape[0] - 1)
+    y = rng.randint(0, pattern.shape[1] - 1)
+    pattern[x, y] = 1 - pattern[x, y]  # Flip the cell state
+
+
+def _resume(checkpoint, resume, kind, params):
+    """Returns the checkpoint to continue from, or None to start afresh."""
+    if not (checkpoint and resume and os.path.exists(checkpoint)):
+        return None
+    state = load_checkpoint(checkpoint)
+    state.check(kind, **params)
+    return state
+
+
+def evolve(rows=20, cols=20, generations=10, population_size=20, fitness_generations=10,
+           backend=None, executor=None, cache=None, rng=None, on_generation=None, boundary="dead", rule=None,
+           checkpoint=None, checkpoint_every=1, resume=False, objective=None, workers=None):
+    """Runs an evolutionary algorithm to find a starting pattern that stays populated.
+
+    Each individual is simulated once: survivors carry their score into the
+    next generation and only new children are sent to ``executor``, a pool
+    of ``workers`` processes (see ``evaluate_population``). A
+    ``FitnessCache`` also skips children identical to any board seen before.
+    ``on_generation(generation, generations, best_fitness)`` is called after
+    every generation for progress reporting. ``objective`` replaces the
+    default score (population after ``fitness_generations``) with any
+    ``objectives.parse_objective`` spec, still one simulation per child.
+
+    With a ``checkpoint`` path the population, scores, history and RNG state
+    are saved every ``checkpoint_every`` generations and at the end, from a
+    background thread. ``resume=True`` continues from that file if it
+    exists, giving exactly the result of an uninterrupted run.
+    """
+    if checkpoint_every < 1:
+        raise ValueError("checkpoint_every must be at least 1")
+    rng = rng or random.Random()
+    params = dict(rows=rows, cols=cols, population_size=population_size, fitness_generations=fitness_generations,
+                  boundary=boundary, rule=str(get_rule(rule)), objective=objective_key(objective))
+    state = _resume(checkpoint, resume, "evolve", params)
+    if state is None:
+        first = 0
+        population = [random_pattern(rows, cols, rng) for _ in range(population_size)]
+        scores = evaluate_population(population, fitness_generations, backend, executor, cache, boundary, rule,
+                                     objective, workers)
+        fitness_history = []
+    else:
+        first = state.generation
+        rng.setstate(state.rng_state)
+        population, scores, fitness_history = list(state.population), state.scores, state.fitness_history
+
+    writer = CheckpointWriter(checkpoint) if checkpoint else None
+
+    def save(generation):
+        writer.write(Checkpoint("evolve", generation, np.stack(population), list(scores), list(fitness_history),
+                                rng.getstate(), params))
+
+    try:
+        for generation in range(first, generations):
+            if writer is not None and generation % checkpoint_every == 0 and generation != first:
+                save(generation)
+
+            # Track the best fitness of this generation
+            best_fitness = max(scores)
+            fitness_history.append(best_fitness)
+            if on_generation is not None:
+                on_generation(generation + 1, generations, best_fitness)
+
+            with metrics.REGISTRY.timer("selection"):
+                # Selection - keep top 50% of the population along with their scores
+                ranked = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:population_size // 2]
+                survivors = [population[i] for i in ranked]
+                survivor_scores = [scores[i] for i in ranked]
+
+                # Crossover and mutation to create new patterns
+                children = []
+                while len(survivors) + len(children) < population_size:
+                    parent1, parent2 = rng.sample(survivors, 2)
+                    child = crossover(parent1, parent2)
+                    mutate(child, rng)
+                    children.append(child)
+
+            population = survivors + children
+            scores = survivor_scores + evaluate_population(children, fitness_generations, backend, executor, cache,
+                                                           boundary, rule, objective, workers)
+
+        if writer is not None:
+            save(max(first, generations))
+    finally:
+        if writer is not None:
+            writer.close()
+
+    best_index = max(range(len(scores)), key=lambda i: scores[i])
+    return EvolutionResult(population[best_index], scores[best_index], fitness_history)
+
+
+def evolve_batch(rows=20, cols=20, generations=10, population_size=20, fitness_generations=10,
+                 seed=None, on_generation=None, boundary="dead", rule=None,
+                 checkpoint=None, checkpoint_every=1, resume=False):
+    """Runs the same evolutionary algorithm with the whole population held in one 3-D array.
+
+    Simulation, selection, crossover and mutation are all array operations
+    over the (population, rows, cols) batch, so there is no per-individual
+    Python work; use this when evolving thousands of small boards. Only the
+    ``"dead"`` and ``"torus"`` boundaries are supported. ``checkpoint``,
+    ``checkpoint_every`` and ``resume`` work as in ``evolve``.
+    """
+    if checkpoint_every < 1:
+        raise ValueError("checkpoint_every must be at least 1")
+    rng = np.random.default_rng(seed)
+    rule = get_rule(rule)
+    params = dict(rows=rows, cols=cols, population_size=population_size, fitness_generations=fitness_generations,
+                  boundary=boundary, rule=str(rule))
+    state = _resume(checkpoint, resume, "evolve_batch", params)
+    if state is None:
+        start = 0
+        population = batch.random_population(population_size, rows, cols, rng)
+        with metrics.REGISTRY.timer("fitness"):
+            scores = batch.evaluate_batch(population, fitness_generations, boundary, rule)
+        metrics.REGISTRY.increment("fitness_patterns", population_size)
+        fitness_history = []
+    else:
+        start = state.generation
+        rng.bit_generator.state = state.rng_state
+        population, scores, fitness_history = state.population, np.array(state.scores), state.fitness_history
+    survivor_count = population_size // 2
+
+    writer = CheckpointWriter(checkpoint) if checkpoint else None
+
+    def save(generation):
+        writer.write(Checkpoint("evolve_batch", generation, population, scores, list(fitness_history),
+                                rng.bit_generator.state, params))
+
+    try:
+        for generation in range(start, generations):
+            if writer is not None and generation % checkpoint_every == 0 and generation != start:
+                save(generation)
+
+            best_fitness = int(scores.max())
+            fitness_history.append(best_fitness)
+            if on_generation is not None:
+                on_generation(generation + 1, generations, best_fitness)
+
+            with metrics.REGISTRY.timer("selection"):
+                # Selection - keep top 50%, ties broken by position as in evolve()
+                ranked = np.argsort(-scores, kind="stable")[:survivor_count]
+                survivors, survivor_scores = population[ranked], scores[ranked]
+
+                # Crossover and mutation: each child gets two distinct random parents
+                child_count = population_size - survivor_count
+                first = rng.integers(0, survivor_count, child_count)
+                second = (first + rng.integers(1, survivor_count, child_count)) % survivor_count
+                children = batch.mutate_batch(batch.crossover_batch(survivors[first], survivors[second]), rng)
+
+            population = np.concatenate([survivors, children])
+            with metrics.REGISTRY.timer("fitness"):
+                child_scores = batch.evaluate_batch(children, fitness_generations, boundary, rule)
+            metrics.REGISTRY.increment("fitness_patterns", len(children))
+            scores = np.concatenate([survivor_scores, child_scores])
+
+        if writer is not None:
+            save(max(start, generations))
+    finally:
+        if writer is not None:
+            writer.close()
+
+    best_index = int(scores.argmax())
+    return EvolutionResult(population[best_index], int(scores[best_index]), fitness_history)
@@ -0,0 +1,212 @@
+import hashlib
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import batch
+import engine
+import metrics
+from objectives import objective_key
+from rules import get_rule
+
+MIN_CHUNK_SIZE = 64  # Patterns per worker task; smaller populations are scored in-process
+
+
+def pack_pattern(pattern):
+    """Packs a board into a small picklable (rows, cols, bytes) tuple, one bit per cell."""
+    board = engine.to_array(pattern)
+    return board.shape[0], board.shape[1], np.packbits(board).tobytes()
+
+
+def unpack_pattern(packed):
+    """Restores a uint8 board from ``pack_pattern`` output."""
+    rows, cols, data = packed
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8), count=rows * cols)
+    return bits.reshape(rows, cols)
+
+
+def score_packed(packed, generations=10, backend=None, boundary=engine.DEFAULT_BOUNDARY, rule=None, objective=None):
+    """Evaluates one packed pattern; runs inside worker processes."""
+    return engine.evaluate_fitness(unpack_pattern(packed), generations, backend, boundary, rule, objective)
+
+
+def _score_all(packed_patterns, generations, backend, boundary=engine.DEFAULT_BOUNDARY, rule=None, objective=None):
+    shapes = {packed[:2] for packed in packed_patterns}
+    if (backend in (None, "numpy") and boundary != "infinite" and len(shapes) == 1
+            and objective in (None, "population")):
+        # Same-sized boards are simulated together in one vectorized batch
+        boards = np.stack([unpack_pattern(packed) for packed in packed_patterns])
+        return batch.evaluate_batch(boards, generations, boundary, get_rule(rule)).tolist()
+    return [score_packed(packed, generations, backend, boundary, rule, objective) for packed in packed_patterns]
+
+
+def make_executor(workers=None):
+    """Creates a process pool for fitness evaluation, or None to evaluate in-process.
+
+    Workers are started with "forkserver" (or "spawn") rather than "fork":
+    the UI creates the pool from a thread while Qt and the simulation
+    thread are running, and forking a multithreaded process is unsafe.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        return None
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+
+
+def _score_packed_list(packed, generations, backend, executor, boundary=engine.DEFAULT_BOUNDARY, rule=None,
+                       objective=None, workers=None):
+    if executor is None or len(packed) <= MIN_CHUNK_SIZE:
+        # Too few patterns to repay pickling them to other processes; the batch path scores them fastest here
+        return _score_all(packed, generations, backend, boundary, rule, objective)
+
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(MIN_CHUNK_SIZE, -(-len(packed) // (workers * 4)))
+    futures = [
+        executor.submit(_score_all, packed[start:start + chunk_size], generations, backend, boundary, rule, objective)
+        for start in range(0, len(packed), chunk_size)
+    ]
+    scores = []
+    for future in futures:
+        scores.extend(future.result())
+    return scores
+
+
+def evaluate_population(population, generations=10, backend=None, executor=None, cache=None,
+                        boundary=engine.DEFAULT_BOUNDARY, rule=None, objective=None, workers=None):
+    """Scores every pattern in the population exactly once.
+
+    Patterns are sent to the executor bit-packed, in chunks of at least
+    ``MIN_CHUNK_SIZE``, so a pool spends its time simulating rather than
+    pickling; smaller populations are scored in-process. Any object with
+    ``submit`` (a ``concurrent.futures`` executor) can be plugged in, with
+    ``workers`` its number of processes (default ``os.cpu_count()``);
+    without one the population is scored serially. With a ``FitnessCache``, patterns
+    scored before, and duplicates within the population, are not simulated.
+    ``rule`` is a Life-like rulestring (default B3/S23) and ``objective``
+    an ``objectives.parse_objective`` spec (default: population after
+    ``generations``).
+    """
+    with metrics.REGISTRY.timer("fitness"):
+        scores = _evaluate_population(population, generations, backend, executor, cache, boundary, rule,
+                                      objective, workers)
+    metrics.REGISTRY.increment("fitness_patterns", len(scores))
+    if cache is not None:
+        stats = cache.stats()
+        metrics.REGISTRY.set_gauges(fitness_cache_entries=stats["entries"], fitness_cache_hits=stats["hits"],
+                                    fitness_cache_misses=stats["misses"], fitness_cache_hit_rate=stats["hit_rate"])
+    return scores
+
+
+def _evaluate_population(population, generations, backend, executor, cache, boundary, rule, objective, workers):
+    rule = str(get_rule(rule))  # Sent to workers and used in cache keys as the canonical rulestring
+    objective = objective_key(objective)
+    if objective == objective_key():
+        objective = None  # The default objective keeps the vectorized batch path
+    packed = [pack_pattern(pattern) for pattern in population]
+    if cache is None:
+        return _score_packed_list(packed, generations, backend, executor, boundary, rule, objective, workers)
+
+    scores = [None] * len(packed)
+    pending = {}  # Cache key -> indices of the patterns sharing it
+    for index, item in enumerate(packed):
+        key = cache.key(item, generations, boundary, rule, objective)
+        if key in pending:  # Duplicate of a pattern already queued in this population
+            cache.hits += 1
+            pending[key].append(index)
+            continue
+        score = cache.get(key)
+        if score is not None:
+            scores[index] = score
+        else:
+            pending[key] = [index]
+
+    keys = list(pending)
+    fresh = _score_packed_list([packed[pending[key][0]] for key in keys], generations, backend, executor,
+                               boundary, rule, objective, workers)
+    for key, score in zip(keys, fresh):
+        cache.put(key, score)
+        for index in pending[key]:
+            scores[index] = score
+    return scores
+
+
+class FitnessCache:
+    """LRU cache of fitness scores keyed by a hash of the packed board and simulation parameters.
+
+    With ``symmetric=True`` a board and its mirror images/rotations share one
+    entry; this is exact because every boundary mode treats each symmetry of
+    the board rectangle alike. ``translation=True`` additionally keys on the
+    live cells cropped to their bounding box, which is only exact when the
+    board edges cannot influence the result, so it is only allowed with the
+    infinite boundary.
+    """
+
+    def __init__(self, max_entries=100_000, symmetric=False, translation=False):
+        self.max_entries = max_entries
+        self.symmetric = symmetric
+        self.translation = translation
+        self._scores = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._scores)
+
+    def _variants(self, board):
+        if self.translation:
+            rows, cols = np.nonzero(board)
+            if len(rows):
+                board = board[rows.min():rows.max() + 1, cols.min():cols.max() + 1]
+        if not self.symmetric:
+            return [board]
+        variants = [board, board[::-1], board[:, ::-1], board[::-1, ::-1]]
+        if board.shape[0] == board.shape[1]:  # Transposes keep the shape only on square boards
+            variants += [variant.T for variant in variants]
+        return variants
+
+    def key(self, packed, generations, boundary=engine.DEFAULT_BOUNDARY, *params):
+        """Returns the cache key of a packed pattern for the given simulation parameters."""
+        if self.translation and boundary != "infinite":
+            raise ValueError(f"A translation-invariant cache gives wrong scores on the '{boundary}' boundary")
+        rows, cols, data = packed
+        if self.symmetric or self.translation:
+            board = unpack_pattern(packed)
+            data = min(np.packbits(variant).tobytes() + bytes(str(variant.shape), "ascii")
+                       for variant in self._variants(board))
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        return (rows, cols, digest, generations, boundary) + params
+
+    def get(self, key):
+        """Returns the cached score for a key, or None on a miss."""
+        score = self._scores.get(key)
+        if score is None:
+            self.misses += 1
+            return None
+        self._scores.move_to_end(key)
+        self.hits += 1
+        return score
+
+    def put(self, key, score):
+        """Stores a score, evicting the least recently used entry when full."""
+        self._scores[key] = score
+        self._scores.move_to_end(key)
+        while len(self._scores) > self.max_entries:
+            self._scores.popitem(last=False)
+            self.evictions += 1
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """Returns the hit/miss counters as a dict."""
+        return {
+            "entries": len(self._scores),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate(),
+        }
@@ -0,0 +1,153 @@
+import numpy as np
+from PyQt5.QtCore import QPointF, QRectF, Qt, pyqtSignal
+from PyQt5.QtGui import QColor, QImage, QPainter, QPen
+from PyQt5.QtWidgets import QSizePolicy, QWidget
+import metrics
+
+DEAD_COLOR = QColor("#f0f0f0")
+ALIVE_COLOR = QColor("#21c362")
+GRID_LINE_COLOR = QColor("#cccccc")
+
+MIN_CELL_SIZE = 0.25
+MAX_CELL_SIZE = 64.0
+GRID_LINE_MIN_CELL_SIZE = 6  # Grid lines are only drawn when cells are at least this many pixels wide
+
+
+class GridCanvas(QWidget):
+    """Draws the whole board as one indexed QImage instead of a widget per cell.
+
+    The image wraps the uint8 board buffer directly (0 = dead, 1 = alive in
+    the colour table), so showing a generation is a single scaled blit.
+    Only the bounding box of the cells that changed since the last board
+    is repainted. Scroll to zoom around the cursor, drag with the right or
+    middle button to pan, and left-click to toggle a cell.
+    """
+
+    cellClicked = pyqtSignal(int, int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.board = None
+        self.image = None
+        self.cell_size = 30.0
+        self.offset = QPointF(0, 0)  # Widget position of the board's top-left corner
+        self._fitted = False
+        self._drag_start = None
+
+    def set_board(self, board):
+        """Shows a new generation, repainting only the region that changed."""
+        board = np.ascontiguousarray(board, dtype=np.uint8)
+        previous = self.board
+        self.board = board.copy()  # The image shares this buffer, so keep our own copy alive
+        rows, cols = self.board.shape
+        self.image = QImage(self.board.data, cols, rows, cols, QImage.Format_Indexed8)
+        self.image.setColorTable([DEAD_COLOR.rgb(), ALIVE_COLOR.rgb()])
+
+        if previous is None or previous.shape != board.shape:
+            self._fitted = False
+            self.fit_to_view()
+            return
+
+        changed_rows, changed_cols = np.nonzero(previous != board)
+        if len(changed_rows):
+            self.update(self.cell_rect(
+                changed_rows.min(), changed_cols.min(),
+                changed_rows.max() - changed_rows.min() + 1, changed_cols.max() - changed_cols.min() + 1,
+            ))
+
+    def fit_to_view(self):
+        """Zooms so the whole board fits in the widget, centred."""
+        if self.board is None or self.width() == 0 or self.height() == 0:
+            return
+        rows, cols = self.board.shape
+        self.cell_size = max(MIN_CELL_SIZE, min(MAX_CELL_SIZE, self.width() / cols, self.height() / rows))
+        self.offset = QPointF((self.width() - cols * self.cell_size) / 2, (self.height() - rows * self.cell_size) / 2)
+        self._fitted = True
+        self.update()
+
+    def cell_rect(self, x, y, rows=1, cols=1):
+        """Returns the widget rectangle covering a block of cells, rounded outwards."""
+        rect = QRectF(self.offset.x() + y * self.cell_size, self.offset.y() + x * self.cell_size,
+                      cols * self.cell_size, rows * self.cell_size)
+        return rect.toAlignedRect().adjusted(-1, -1, 1, 1)
+
+    def cell_at(self, pos):
+        """Returns the (x, y) cell under a widget position, or None outside the board."""
+        if self.board is None:
+            return None
+        x = int((pos.y() - self.offset.y()) // self.cell_size)
+        y = int((pos.x() - self.offset.x()) // self.cell_size)
+        rows, cols = self.board.shape
+        if 0 <= x < rows and 0 <= y < cols:
+            return x, y
+        return None
+
+    def paintEvent(self, event):
+        with metrics.REGISTRY.timer("paint"):
+            self._paint(event)
+
+    def _paint(self, event):
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), Qt.white)
+        if self.image is None:
+            return
+
+        rows, cols = self.board.shape
+        target = QRectF(self.offset.x(), self.offset.y(), cols * self.cell_size, rows * self.cell_size)
+        painter.drawImage(target, self.image, QRectF(0, 0, cols, rows))
+
+        if self.cell_size >= GRID_LINE_MIN_CELL_SIZE:
+            # Only draw the lines crossing the exposed region
+            exposed = event.rect()
+            first_row = max(0, int((exposed.top() - self.offset.y()) // self.cell_size))
+            last_row = min(rows, int((exposed.bottom() - self.offset.y()) // self.cell_size) + 1)
+            first_col = max(0, int((exposed.left() - self.offset.x()) // self.cell_size))
+            last_col = min(cols, int((exposed.right() - self.offset.x()) // self.cell_size) + 1)
+            painter.setPen(QPen(GRID_LINE_COLOR, 1))
+            for x in range(first_row, last_row + 1):
+                line_y = self.offset.y() + x * self.cell_size
+                painter.drawLine(QPointF(self.offset.x() + first_col * self.cell_size, line_y),
+                                 QPointF(self.offset.x() + last_col * self.cell_size, line_y))
+            for y in range(first_col, last_col + 1):
+                line_x = self.offset.x() + y * self.cell_size
+                painter.drawLine(QPointF(line_x, self.offset.y() + first_row * self.cell_size),
+                                 QPointF(line_x, self.offset.y() + last_row * self.cell_size))
+
+    def resizeEvent(self, event):
+        if not self._fitted:
+            self.fit_to_view()
+        super().resizeEvent(event)
+
+    def wheelEvent(self, event):
+        # Zoom around the cursor so the cell under it stays put
+        factor = 1.25 if event.angleDelta().y() > 0 else 0.8
+        new_size = max(MIN_CELL_SIZE, min(MAX_CELL_SIZE, self.cell_size * factor))
+        pos = QPointF(event.pos())
+        self.offset = pos - (pos - self.offset) * (new_size / self.cell_size)
+        self.cell_size = new_size
+        self.update()
+
+    def mousePressEvent(self, event):
+        if event.button() in (Qt.RightButton, Qt.MiddleButton):
+            self._drag_start = (event.pos(), QPointF(self.offset))
+        elif event.button() == Qt.LeftButton:
+            cell = self.cell_at(event.pos())
+            if cell is not None:
+                self.cellClicked.emit(*cell)
+
+    def mouseMoveEvent(self, event):
+        if self._drag_start is not None:
+            start, offset = self._drag_start
+            self.offset = offset + QPointF(event.pos() - start)
+            self.update()
+
+    def mouseReleaseEvent(self, event):
+        self._drag_start = None
+
+    def mouseDoubleClickEvent(self, event):
+        if event.button() in (Qt.RightButton, Qt.MiddleButton):
+            self.fit_to_view()
+        else:
+            self.mousePressEvent(event)
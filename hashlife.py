@@ -0,0 +1,267 @@
+import numpy as np
+from rules import get_rule
+
+DEFAULT_MAX_NODES = 1_000_000
+
+
+class Node:
+    """A canonical quadtree node covering a 2**level x 2**level square.
+
+    Nodes are hash-consed by their four children, so identical regions are
+    the same object and dictionaries can key on identity.
+    """
+
+    __slots__ = ("level", "nw", "ne", "sw", "se", "population", "future")
+
+    def __init__(self, level, nw=None, ne=None, sw=None, se=None, population=0):
+        self.level = level
+        self.nw, self.ne, self.sw, self.se = nw, ne, sw, se
+        self.population = population
+        self.future = {}  # Memoized centre after 2**j generations, keyed by j
+
+
+class HashLife:
+    """HashLife engine for advancing a pattern huge numbers of generations.
+
+    The pattern lives on an unbounded plane with the board's (0, 0) cell at
+    the origin. Unlike ``LifeEngine``, nothing is clipped at the board edge:
+    gliders fired by a gun keep flying. ``jump(n)`` costs roughly
+    O(log n) successor evaluations for regular patterns, because every
+    distinct block and its future is computed once and then reused.
+    Leaves are advanced with the 4x4 block table of ``rule`` (any Life-like
+    rule without B0).
+    """
+
+    def __init__(self, board=None, max_nodes=DEFAULT_MAX_NODES, rule=None):
+        self.rule = get_rule(rule)
+        if self.rule.births_from_nothing:
+            raise ValueError(f"Rule {self.rule} brings empty cells to life and cannot run on an unbounded plane")
+        self._block_table = self.rule.block_table.tolist()
+        self.max_nodes = max_nodes
+        self._nodes = {}
+        self._empty = []
+        self.off = Node(0)
+        self.on = Node(0, population=1)
+        self.generation = 0
+        self.root = self.empty(3)
+        if board is not None:
+            self.load(board)
+
+    # Node construction
+
+    def join(self, nw, ne, sw, se):
+        """Returns the canonical node with the given four children."""
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            population = nw.population + ne.population + sw.population + se.population
+            node = Node(nw.level + 1, nw, ne, sw, se, population)
+            self._nodes[key] = node
+        return node
+
+    def empty(self, level):
+        """Returns the canonical all-dead node of the given level."""
+        while len(self._empty) <= level:
+            if not self._empty:
+                self._empty.append(self.off)
+            else:
+                smaller = self._empty[-1]
+                self._empty.append(self.join(smaller, smaller, smaller, smaller))
+        return self._empty[level]
+
+    def centre(self, node):
+        """Returns a node one level up with ``node`` in its middle, padded with dead cells."""
+        border = self.empty(node.level - 1)
+        return self.join(
+            self.join(border, border, border, node.nw),
+            self.join(border, border, node.ne, border),
+            self.join(border, node.sw, border, border),
+            self.join(node.se, border, border, border),
+        )
+
+    def _inner(self, node):
+        """Returns the central quarter-width block of a node (two levels down)."""
+        return self.join(node.nw.se.se, node.ne.sw.sw, node.sw.ne.ne, node.se.nw.nw)
+
+    # Simulation
+
+    def _life_4x4(self, node):
+        """Advances the centre 2x2 of a level-2 node by one generation with a single table lookup."""
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        # Row-major 16-bit index of the 4x4 block, first cell in the highest bit
+        index = 0
+        for cell in (nw.nw, nw.ne, ne.nw, ne.ne, nw.sw, nw.se, ne.sw, ne.se,
+                     sw.nw, sw.ne, se.nw, se.ne, sw.sw, sw.se, se.sw, se.se):
+            index = (index << 1) | cell.population
+        centre = self._block_table[index]
+        cells = [self.on if centre >> bit & 1 else self.off for bit in (3, 2, 1, 0)]
+        return self.join(*cells)
+
+    def successor(self, node, j):
+        """Returns the centre of ``node`` (one level down) advanced by 2**min(j, level - 2) generations."""
+        if node.population == 0:
+            return node.nw
+        j = min(j, node.level - 2)
+        result = node.future.get(j)
+        if result is not None:
+            return result
+
+        if node.level == 2:
+            result = self._life_4x4(node)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            # Nine overlapping sub-squares, each advanced by up to half the step
+            c1 = self.successor(nw, j)
+            c2 = self.successor(self.join(nw.ne, ne.nw, nw.se, ne.sw), j)
+            c3 = self.successor(ne, j)
+            c4 = self.successor(self.join(nw.sw, nw.se, sw.nw, sw.ne), j)
+            c5 = self.successor(self.join(nw.se, ne.sw, sw.ne, se.nw), j)
+            c6 = self.successor(self.join(ne.sw, ne.se, se.nw, se.ne), j)
+            c7 = self.successor(sw, j)
+            c8 = self.successor(self.join(sw.ne, se.nw, sw.se, se.sw), j)
+            c9 = self.successor(se, j)
+            if j < node.level - 2:
+                # The sub-squares already advanced the full 2**j: just take their centres
+                result = self.join(
+                    self.join(c1.se, c2.sw, c4.ne, c5.nw),
+                    self.join(c2.se, c3.sw, c5.ne, c6.nw),
+                    self.join(c4.se, c5.sw, c7.ne, c8.nw),
+                    self.join(c5.se, c6.sw, c8.ne, c9.nw),
+                )
+            else:
+                result = self.join(
+                    self.successor(self.join(c1, c2, c4, c5), j),
+                    self.successor(self.join(c2, c3, c5, c6), j),
+                    self.successor(self.join(c4, c5, c7, c8), j),
+                    self.successor(self.join(c5, c6, c8, c9), j),
+                )
+        node.future[j] = result
+        return result
+
+    def jump(self, generations):
+        """Advances the pattern by exactly ``generations`` generations."""
+        if generations < 0:
+            raise ValueError("Cannot jump backwards in time")
+        remaining, j = generations, 0
+        while remaining:
+            if remaining & 1:
+                root = self.root
+                # Pad until the pattern sits in the middle quarter and the node is big enough for 2**j
+                while root.level < j + 2 or self._inner(root).population != root.population:
+                    root = self.centre(root)
+                self.root = self.successor(self.centre(root), j)
+                if len(self._nodes) > self.max_nodes:
+                    self.collect_garbage()
+            remaining >>= 1
+            j += 1
+        self.generation += generations
+        return self
+
+    def step(self):
+        """Advances the pattern by one generation."""
+        return self.jump(1)
+
+    def population(self):
+        return self.root.population
+
+    # Cache management
+
+    def cache_size(self):
+        return len(self._nodes)
+
+    def collect_garbage(self):
+        """Drops every node and memoized result not reachable from the current root.
+
+        ``jump`` calls this between power-of-two steps whenever the node table
+        grows past ``max_nodes``.
+        """
+        reachable = {}
+        stack = [self.root] + self._empty
+        while stack:
+            node = stack.pop()
+            if node.level == 0 or id(node) in reachable:
+                continue
+            reachable[id(node)] = node
+            stack.extend((node.nw, node.ne, node.sw, node.se))
+
+        self._nodes = {}
+        for node in reachable.values():
+            node.future.clear()  # Futures may point at nodes that are about to be dropped
+            self._nodes[(node.nw, node.ne, node.sw, node.se)] = node
+
+    # Conversion to and from boards
+
+    def load(self, board):
+        """Replaces the pattern with a uint8 board whose (0, 0) cell is at the origin."""
+        board = np.array(board, dtype=np.uint8, ndmin=2)
+        rows, cols = board.shape
+        level = 3
+        while (1 << (level - 1)) < max(rows, cols):
+            level += 1
+        half = 1 << (level - 1)
+        plane = np.zeros((2 * half, 2 * half), dtype=np.uint8)
+        plane[half:half + rows, half:half + cols] = board != 0
+        self.root = self._build(plane, level)
+        self.generation = 0
+
+    def _build(self, block, level):
+        if level == 0:
+            return self.on if block[0, 0] else self.off
+        if not block.any():
+            return self.empty(level)
+        half = 1 << (level - 1)
+        return self.join(
+            self._build(block[:half, :half], level - 1),
+            self._build(block[:half, half:], level - 1),
+            self._build(block[half:, :half], level - 1),
+            self._build(block[half:, half:], level - 1),
+        )
+
+    def to_array(self, x0=0, y0=0, rows=20, cols=20):
+        """Renders the window of the plane starting at cell (x0, y0) into a uint8 array."""
+        window = np.zeros((rows, cols), dtype=np.uint8)
+        half = 1 << (self.root.level - 1)
+        self._paint(self.root, -half, -half, window, x0, y0)
+        return window
+
+    def _paint(self, node, x, y, window, x0, y0):
+        size = 1 << node.level
+        rows, cols = window.shape
+        if node.population == 0 or x >= x0 + rows or y >= y0 + cols or x + size <= x0 or y + size <= y0:
+            return
+        if node.level == 0:
+            window[x - x0, y - y0] = 1
+            return
+        half = size >> 1
+        self._paint(node.nw, x, y, window, x0, y0)
+        self._paint(node.ne, x, y + half, window, x0, y0)
+        self._paint(node.sw, x + half, y, window, x0, y0)
+        self._paint(node.se, x + half, y + half, window, x0, y0)
+
+    def bounding_box(self):
+        """Returns (min_x, min_y, max_x, max_y) of the live cells, or None if the pattern is empty."""
+        if self.root.population == 0:
+            return None
+        half = 1 << (self.root.level - 1)
+        box = [None, None, None, None]
+        self._bound(self.root, -half, -half, box)
+        return tuple(box)
+
+    def _bound(self, node, x, y, box):
+        size = 1 << node.level
+        if node.population == 0:
+            return
+        # Skip blocks that cannot widen the box found so far
+        if box[0] is not None and x >= box[0] and y >= box[1] and x + size - 1 <= box[2] and y + size - 1 <= box[3]:
+            return
+        if node.level == 0:
+            box[0] = x if box[0] is None else min(box[0], x)
+            box[1] = y if box[1] is None else min(box[1], y)
+            box[2] = x if box[2] is None else max(box[2], x)
+            box[3] = y if box[3] is None else max(box[3], y)
+            return
+        half = size >> 1
+        self._bound(node.nw, x, y, box)
+        self._bound(node.ne, x, y + half, box)
+        self._bound(node.sw, x + half, y, box)
+        self._bound(node.se, x + half, y + half, box)
@@ -0,0 +1,184 @@
+"""Low-overhead counters, gauges and timers for watching live runs.
+
+Instrumented code records into the shared ``REGISTRY``::
+
+    with metrics.REGISTRY.timer("step"):
+        engine.step()
+    metrics.REGISTRY.increment("generations")
+
+``snapshot()`` returns everything as a dict, ``prometheus_text()`` renders
+it in the Prometheus text exposition format, and ``serve(port)`` publishes
+that on ``http://127.0.0.1:<port>/metrics`` for a local scraper.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+
+PREFIX = "life_"
+DEFAULT_PORT = 9464
+DEFAULT_HISTORY = 10_000
+
+
+class Metrics:
+    """A thread-safe registry of counters, gauges and timers.
+
+    Counters only go up, gauges hold the latest value, and timers keep the
+    count, total and maximum of the durations observed. Recording is a dict
+    update under a lock, so it is cheap enough for per-generation use.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.gauges = {}
+        self.timers = {}  # name -> [count, total seconds, max seconds]
+        self.started = time.time()
+
+    def increment(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def set_gauge(self, name, value):
+        with self._lock:
+            self.gauges[name] = value
+
+    def set_gauges(self, **values):
+        """Sets several gauges at once under one lock."""
+        with self._lock:
+            self.gauges.update(values)
+
+    def observe(self, name, seconds):
+        """Records one duration for a timer."""
+        with self._lock:
+            timer = self.timers.get(name)
+            if timer is None:
+                self.timers[name] = [1, seconds, seconds]
+            else:
+                timer[0] += 1
+                timer[1] += seconds
+                if seconds > timer[2]:
+                    timer[2] = seconds
+
+    @contextmanager
+    def timer(self, name):
+        """Times the body of a ``with`` block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.gauges.clear()
+            self.timers.clear()
+            self.started = time.time()
+
+    def snapshot(self):
+        """Returns a consistent copy of every metric as plain dicts."""
+        with self._lock:
+            timers = {
+                name: {"count": count, "total": total, "mean": total / count if count else 0.0, "max": longest}
+                for name, (count, total, longest) in self.timers.items()
+            }
+            return {
+                "uptime": time.time() - self.started,
+                "counters": dict(self.counters),
+                "gauges": dict(self.gauges),
+                "timers": timers,
+            }
+
+    def prometheus_text(self):
+        """Renders the metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = [f"# TYPE {PREFIX}uptime_seconds gauge", f"{PREFIX}uptime_seconds {snapshot['uptime']:.3f}"]
+        for name, value in sorted(snapshot["counters"].items()):
+            lines += [f"# TYPE {PREFIX}{name}_total counter", f"{PREFIX}{name}_total {value}"]
+        for name, value in sorted(snapshot["gauges"].items()):
+            lines += [f"# TYPE {PREFIX}{name} gauge", f"{PREFIX}{name} {value}"]
+        for name, timer in sorted(snapshot["timers"].items()):
+            lines += [
+                f"# TYPE {PREFIX}{name}_seconds summary",
+                f"{PREFIX}{name}_seconds_count {timer['count']}",
+                f"{PREFIX}{name}_seconds_sum {timer['total']:.9f}",
+                f"# TYPE {PREFIX}{name}_seconds_max gauge",
+                f"{PREFIX}{name}_seconds_max {timer['max']:.9f}",
+            ]
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Metrics()
+
+
+class RingBuffer:
+    """A fixed-capacity history of (x, y) samples; once full, new samples overwrite the oldest.
+
+    Memory and the cost of reading the history are bounded by ``capacity``
+    however long a run goes. ``downsample`` reduces it further for display.
+    """
+
+    def __init__(self, capacity=DEFAULT_HISTORY):
+        self.capacity = capacity
+        self._x = np.zeros(capacity)
+        self._y = np.zeros(capacity)
+        self._next = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def append(self, x, y):
+        self._x[self._next] = x
+        self._y[self._next] = y
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def clear(self):
+        self._next = self._size = 0
+
+    def arrays(self):
+        """Returns copies of the x and y samples, oldest first."""
+        if self._size < self.capacity:
+            return self._x[:self._size].copy(), self._y[:self._size].copy()
+        order = np.r_[self._next:self.capacity, 0:self._next]
+        return self._x[order], self._y[order]
+
+    def downsample(self, max_points):
+        """Returns at most ``max_points`` samples, keeping each bucket's minimum and maximum so peaks survive."""
+        xs, ys = self.arrays()
+        buckets = max_points // 2
+        if len(xs) <= max_points or buckets < 1:
+            return xs, ys
+        edges = np.linspace(0, len(xs), buckets + 1).astype(np.int64)
+        low = np.minimum.reduceat(ys, edges[:-1])
+        high = np.maximum.reduceat(ys, edges[:-1])
+        # Plot each bucket as its first x at the minimum and its last x at the maximum
+        out_x = np.column_stack((xs[edges[:-1]], xs[edges[1:] - 1])).ravel()
+        out_y = np.column_stack((low, high)).ravel()
+        return out_x, out_y
+
+
+def serve(port=DEFAULT_PORT, host="127.0.0.1", registry=REGISTRY):
+    """Serves ``/metrics`` from a daemon thread; returns the server (call ``shutdown()`` to stop it)."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.prometheus_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # Scrapes every few seconds would otherwise flood stderr
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
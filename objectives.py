@@ -0,0 +1,201 @@
+"""Pluggable fitness objectives, all measured in one simulation of each pattern.
+
+An objective is a function of the ``Trace`` recorded while a pattern runs::
+
+    objectives.score(board, 100, "growth")                # one objective
+    objectives.score(board, 100, "longevity=1,gliders=10")  # weighted sum of several
+
+``trace`` steps the board once and records only what the requested
+objectives need, so scoring five objectives costs the same simulation as
+scoring one. New objectives are added with ``register_objective``.
+"""
+from collections import deque
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+import engine
+
+DEFAULT_OBJECTIVE = "population"
+
+
+class Objective:
+    """A named fitness function of a ``Trace``.
+
+    ``needs`` lists the optional measurements the function reads:
+    ``"bounding_box"`` (largest live bounding box of any generation) and
+    ``"live_cells"`` (the final live cells, cropped).
+    """
+
+    def __init__(self, name, function, needs=()):
+        self.name = name
+        self.function = function
+        self.needs = frozenset(needs)
+
+
+OBJECTIVES = {}
+
+
+def register_objective(name, function, needs=()):
+    """Makes a fitness function selectable by name."""
+    OBJECTIVES[name] = Objective(name, function, needs)
+    return OBJECTIVES[name]
+
+
+class Trace:
+    """What one simulation of a pattern recorded for the objectives.
+
+    ``cycle`` is the ``Cycle`` the board settled into, or None if it was
+    still changing after ``generations``. Areas are those of the live
+    cells' bounding box; ``live_cells`` is the final generation cropped to
+    it. Unrequested measurements are None.
+    """
+
+    def __init__(self, generations, initial_population, population, cycle,
+                 initial_area=None, max_area=None, live_cells=None):
+        self.generations = generations
+        self.initial_population = initial_population
+        self.population = population
+        self.cycle = cycle
+        self.initial_area = initial_area
+        self.max_area = max_area
+        self.live_cells = live_cells
+
+
+def _area(box):
+    return 0 if box is None else (box[2] - box[0] + 1) * (box[3] - box[1] + 1)
+
+
+def trace(pattern, generations=10, needs=(), backend=None, boundary=engine.DEFAULT_BOUNDARY, rule=None,
+          history=engine.DEFAULT_CYCLE_HISTORY):
+    """Simulates a pattern once for ``generations`` and returns its ``Trace``.
+
+    Every generation is hashed as in ``LifeEngine.find_cycle``. Once the
+    board repeats, the rest of the run only revisits generations already
+    measured, so whole periods are skipped and just the remainder is
+    stepped to reach the final board.
+    """
+    life = engine.LifeEngine(board=pattern, backend=backend, boundary=boundary, rule=rule)
+    track_area = "bounding_box" in needs
+    initial_population = life.population()
+    initial_area = max_area = _area(life.bounding_box()) if track_area else None
+
+    seen = {life.digest(): 0}
+    order = deque(seen)
+    cycle = None
+    while life.generation < generations:
+        life.advance()
+        if track_area:
+            max_area = max(max_area, _area(life.bounding_box()))
+        digest = life.digest()
+        if digest in seen:
+            start = seen[digest]
+            cycle = engine.Cycle(start, life.generation - start, life.population())
+            break
+        seen[digest] = life.generation
+        order.append(digest)
+        if len(order) > history:
+            del seen[order.popleft()]
+    if cycle is not None:
+        for _ in range((generations - life.generation) % cycle.period):
+            life.advance()
+
+    live_cells = life.live_cells() if "live_cells" in needs else None
+    return Trace(generations, initial_population, life.population(), cycle, initial_area, max_area, live_cells)
+
+
+def _glider_keys():
+    """Returns the 25-bit keys of every phase and orientation of a glider alone in a 5x5 window."""
+    phases = [
+        [[0, 1, 0], [0, 0, 1], [1, 1, 1]],
+        [[1, 0, 1], [0, 1, 1], [0, 1, 0]],
+        [[0, 0, 1], [1, 0, 1], [0, 1, 1]],
+        [[1, 0, 0], [0, 1, 1], [1, 1, 0]],
+    ]
+    keys = set()
+    for phase in phases:
+        cells = np.array(phase, dtype=np.int64)
+        for variant in (cells, cells[::-1], cells[:, ::-1], cells[::-1, ::-1]):
+            for oriented in (variant, variant.T):
+                keys.add(int(np.pad(oriented, 1).ravel() @ _WINDOW_BITS))
+    return np.array(sorted(keys), dtype=np.int64)
+
+
+_WINDOW_BITS = 1 << np.arange(24, -1, -1, dtype=np.int64)
+GLIDER_KEYS = _glider_keys()
+
+
+def count_gliders(cells):
+    """Counts gliders with an empty one-cell border around them, in any phase and direction."""
+    if cells.size == 0:
+        return 0
+    padded = np.pad(np.asarray(cells, dtype=np.int64), 2)
+    keys = sliding_window_view(padded, (5, 5)).reshape(-1, 25) @ _WINDOW_BITS
+    return int(np.isin(keys, GLIDER_KEYS).sum())
+
+
+def _growth(trace):
+    return (trace.population - trace.initial_population) / max(trace.initial_population, 1)
+
+
+def _longevity(trace):
+    return trace.generations if trace.cycle is None else trace.cycle.start
+
+
+def _bounding_box_expansion(trace):
+    return trace.max_area / trace.initial_area if trace.initial_area else 0.0
+
+
+def _period(trace):
+    return 0 if trace.cycle is None or trace.cycle.extinct else trace.cycle.period
+
+
+register_objective("population", lambda trace: trace.population)
+register_objective("growth", _growth)
+register_objective("longevity", _longevity)
+register_objective("bbox_expansion", _bounding_box_expansion, needs=("bounding_box",))
+register_objective("period", _period)
+register_objective("gliders", lambda trace: count_gliders(trace.live_cells), needs=("live_cells",))
+
+
+def parse_objective(objective=None):
+    """Returns {name: weight} for an objective spec such as ``"growth"`` or ``"longevity=1,gliders=10"``.
+
+    A dict of weights is accepted as is; None means ``DEFAULT_OBJECTIVE``.
+    Raises ValueError for unknown objectives or malformed weights.
+    """
+    if objective is None:
+        objective = DEFAULT_OBJECTIVE
+    if isinstance(objective, dict):
+        weights = dict(objective)
+    else:
+        weights = {}
+        for term in str(objective).split(","):
+            name, _, weight = term.strip().partition("=")
+            try:
+                weight = float(weight) if weight else 1
+            except ValueError:
+                raise ValueError(f"Invalid weight '{weight}' for objective '{name}'") from None
+            weights[name] = int(weight) if float(weight).is_integer() else weight
+    for name in weights:
+        if name not in OBJECTIVES:
+            raise ValueError(f"Unknown objective '{name}', expected one of: {', '.join(sorted(OBJECTIVES))}")
+    if not weights:
+        raise ValueError("Empty objective")
+    return weights
+
+
+def objective_key(objective=None):
+    """Returns the canonical string of an objective spec, for cache keys and checkpoints."""
+    return ",".join(f"{name}={weight}" for name, weight in sorted(parse_objective(objective).items()))
+
+
+def score(pattern, generations=10, objective=None, backend=None, boundary=engine.DEFAULT_BOUNDARY, rule=None):
+    """Scores a pattern by the weighted sum of its objectives, from a single simulation.
+
+    A lone objective with weight 1 returns its value unchanged.
+    """
+    weights = parse_objective(objective)
+    needs = set().union(*(OBJECTIVES[name].needs for name in weights))
+    result = trace(pattern, generations, needs, backend, boundary, rule)
+    if len(weights) == 1 and next(iter(weights.values())) == 1:
+        return OBJECTIVES[next(iter(weights))].function(result)
+    return sum(weight * OBJECTIVES[name].function(result) for name, weight in weights.items())
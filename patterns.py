@@ -0,0 +1,299 @@
+import io
+import json
+import os
+import re
+from array import array
+import numpy as np
+
+PATTERN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "patterns")
+PATTERN_EXTENSIONS = (".rle", ".lif", ".life")
+INDEX_FILE = ".index.json"
+INDEX_VERSION = 1
+
+RLE_LINE_LENGTH = 70
+
+_RLE_HEADER = re.compile(r"x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)(?:\s*,\s*rule\s*=\s*(\S+))?", re.IGNORECASE)
+_RLE_TOKEN = re.compile(r"(\d*)([^\d\s])")
+
+
+class Pattern:
+    """A named pattern decoded into a uint8 array of its declared extent."""
+
+    def __init__(self, name, cells, rule="B3/S23", comments=None):
+        self.name = name
+        self.cells = cells
+        self.rule = rule
+        self.comments = comments or []
+
+    @property
+    def rows(self):
+        return self.cells.shape[0]
+
+    @property
+    def cols(self):
+        return self.cells.shape[1]
+
+    def population(self):
+        return int(self.cells.sum())
+
+    def bounding_box(self):
+        """Returns (min_x, min_y, max_x, max_y) of the live cells, or None if the pattern is empty."""
+        xs, ys = np.nonzero(self.cells)
+        if not len(xs):
+            return None
+        return int(xs.min()), int(ys.min()), int(xs.max()), int(ys.max())
+
+    def packed(self):
+        """Returns the cells bit-packed, eight per byte."""
+        return np.packbits(self.cells)
+
+
+def _open_text(source):
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, "r", encoding="ascii", errors="replace")
+    return source
+
+
+def read_rle(source, name=None):
+    """Parses an RLE pattern from a path or text stream.
+
+    Runs are written straight into a preallocated array one slice at a time,
+    so decoding cost follows the number of runs rather than the number of
+    cells.
+    """
+    stream = _open_text(source)
+    try:
+        comments, cells, rule = [], None, "B3/S23"
+        x = y = 0
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            if cells is None:
+                if line.startswith("#"):
+                    if line[1:2] == "N":
+                        name = name or line[2:].strip()
+                    else:
+                        comments.append(line[2:].strip())
+                    continue
+                header = _RLE_HEADER.match(line)
+                if header is None:
+                    raise ValueError(f"Missing RLE header line, got: {line[:40]}")
+                rows, cols = int(header.group(2)), int(header.group(1))
+                rule = header.group(3) or rule
+                cells = np.zeros((rows, cols), dtype=np.uint8)
+                continue
+
+            for count, tag in _RLE_TOKEN.findall(line):
+                count = int(count) if count else 1
+                if tag == "!":
+                    return Pattern(name or "Untitled", cells, rule, comments)
+                if tag == "$":
+                    x, y = x + count, 0
+                elif tag in "b.":
+                    y += count
+                else:  # 'o' and any multi-state letter count as alive
+                    if x >= cells.shape[0] or y + count > cells.shape[1]:
+                        raise ValueError(f"RLE run at row {x}, column {y} exceeds the declared {cells.shape[1]}x{cells.shape[0]}")
+                    cells[x, y:y + count] = 1
+                    y += count
+        if cells is None:
+            raise ValueError("Empty RLE pattern")
+        return Pattern(name or "Untitled", cells, rule, comments)
+    finally:
+        if stream is not source:
+            stream.close()
+
+
+def write_rle(pattern, target):
+    """Writes a pattern as RLE to a path or text stream."""
+    lines = [f"#N {pattern.name}"] + [f"#C {comment}" for comment in pattern.comments]
+    lines.append(f"x = {pattern.cols}, y = {pattern.rows}, rule = {pattern.rule}")
+
+    tokens = []
+    blank_rows = 0
+    for row in pattern.cells:
+        # Boundaries between runs of equal cells, found for the whole row at once
+        edges = np.flatnonzero(np.diff(row)) + 1
+        starts = np.concatenate(([0], edges))
+        lengths = np.diff(np.concatenate((starts, [len(row)])))
+        values = row[starts]
+        if values[-1] == 0:  # Trailing dead cells are implied
+            starts, lengths, values = starts[:-1], lengths[:-1], values[:-1]
+        if not len(values):
+            blank_rows += 1
+            continue
+        if tokens or blank_rows:
+            newlines = blank_rows + 1 if tokens else blank_rows
+            if newlines:
+                tokens.append(f"{newlines if newlines > 1 else ''}$")
+        blank_rows = 0
+        tokens.extend(f"{length if length > 1 else ''}{'o' if value else 'b'}" for length, value in zip(lengths, values))
+    tokens.append("!")
+
+    body, line = [], ""
+    for token in tokens:
+        if len(line) + len(token) > RLE_LINE_LENGTH:
+            body.append(line)
+            line = ""
+        line += token
+    body.append(line)
+    _write_text(target, "\n".join(lines + body) + "\n")
+
+
+def read_life106(source, name=None):
+    """Parses a Life 1.06 pattern (one "x y" coordinate pair per line) from a path or text stream.
+
+    Lines are consumed one at a time into a compact integer buffer, so the
+    file is never held in memory as text.
+    """
+    stream = _open_text(source)
+    try:
+        comments, values = [], array("q")
+        for line in stream:
+            if line.startswith("#"):
+                if line.startswith("#N"):
+                    name = name or line[2:].strip()
+                elif not line.startswith("#Life"):
+                    comments.append(line[2:].strip())
+            elif line.strip():
+                values.extend(map(int, line.split()))
+    finally:
+        if stream is not source:
+            stream.close()
+    if len(values) % 2:
+        raise ValueError("Life 1.06 coordinates must come in x y pairs")
+    coordinates = np.frombuffer(values, dtype=np.int64).reshape(-1, 2)
+    if not len(coordinates):
+        return Pattern(name or "Untitled", np.zeros((0, 0), dtype=np.uint8), comments=comments)
+
+    # Life 1.06 lists (column, row); shift so the pattern starts at (0, 0)
+    cols, rows = coordinates[:, 0] - coordinates[:, 0].min(), coordinates[:, 1] - coordinates[:, 1].min()
+    cells = np.zeros((rows.max() + 1, cols.max() + 1), dtype=np.uint8)
+    cells[rows, cols] = 1
+    return Pattern(name or "Untitled", cells, comments=comments)
+
+
+def write_life106(pattern, target):
+    """Writes a pattern in Life 1.06 format to a path or text stream."""
+    rows, cols = np.nonzero(pattern.cells)
+    lines = ["#Life 1.06", f"#N {pattern.name}"] + [f"#C {comment}" for comment in pattern.comments]
+    lines.extend(f"{col} {row}" for row, col in zip(rows.tolist(), cols.tolist()))
+    _write_text(target, "\n".join(lines) + "\n")
+
+
+def _write_text(target, text):
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "w", encoding="ascii") as stream:
+            stream.write(text)
+    else:
+        target.write(text)
+
+
+def read_pattern(path, name=None):
+    """Reads a pattern file, picking the format from its extension or header."""
+    with open(path, "r", encoding="ascii", errors="replace") as stream:
+        first_line = stream.readline()
+        stream.seek(0)
+        if first_line.startswith("#Life 1.06") or path.lower().endswith((".lif", ".life")):
+            return read_life106(stream, name)
+        return read_rle(stream, name)
+
+
+def parse_rle(text, name=None):
+    """Parses RLE from a string."""
+    return read_rle(io.StringIO(text), name)
+
+
+class PatternLibrary:
+    """An on-disk collection of pattern files with a cached metadata index.
+
+    The index records each file's name, size, bounding box and population and
+    is stored next to the patterns. Files whose modification time and size
+    are unchanged are not re-parsed, so listing a large collection only costs
+    a directory scan. Patterns themselves are decoded on ``load``. Files
+    that cannot be read or parsed are left out and their errors kept in
+    ``errors`` (file name -> message), so one bad file never hides the rest.
+    """
+
+    def __init__(self, directory=PATTERN_DIR, index_path=None):
+        self.directory = directory
+        self.index_path = index_path or os.path.join(directory, INDEX_FILE)
+        self.entries = {}
+        self.errors = {}
+        self.refresh()
+
+    def refresh(self):
+        """Rescans the directory, re-indexing only new or modified files."""
+        cached = self._read_index()
+        entries, errors, changed = {}, {}, False
+        for file_name in sorted(os.listdir(self.directory)) if os.path.isdir(self.directory) else []:
+            if not file_name.lower().endswith(PATTERN_EXTENSIONS):
+                continue
+            path = os.path.join(self.directory, file_name)
+            try:
+                stat = os.stat(path)
+                entry = cached.get(file_name)
+                if entry is None or entry["mtime"] != stat.st_mtime or entry["size"] != stat.st_size:
+                    entry = self._index_file(file_name, path, stat)
+                    changed = True
+            except (ValueError, OSError) as error:
+                errors[file_name] = str(error)
+                continue
+            name = entry["name"]
+            if name in entries:  # Another file has the same #N name; keep both visible
+                name = f"{name} ({file_name})"
+            entries[name] = entry
+        changed = changed or len(entries) != len(cached)
+        self.entries = dict(sorted(entries.items()))
+        self.errors = errors
+        if changed:
+            self._write_index()
+
+    def _index_file(self, file_name, path, stat):
+        pattern = read_pattern(path)
+        return {
+            "file": file_name,
+            "name": pattern.name if pattern.name != "Untitled" else os.path.splitext(file_name)[0],
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "rows": pattern.rows,
+            "cols": pattern.cols,
+            "rule": pattern.rule,
+            "population": pattern.population(),
+            "bounding_box": pattern.bounding_box(),
+        }
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as stream:
+                index = json.load(stream)
+        except (OSError, ValueError):
+            return {}
+        if index.get("version") != INDEX_VERSION:
+            return {}
+        return {entry["file"]: entry for entry in index.get("patterns", [])}
+
+    def _write_index(self):
+        index = {"version": INDEX_VERSION, "patterns": list(self.entries.values())}
+        try:
+            with open(self.index_path, "w", encoding="utf-8") as stream:
+                json.dump(index, stream, indent=1)
+        except OSError:
+            pass  # A read-only library still works, it is just re-indexed on the next start
+
+    def names(self):
+        return list(self.entries)
+
+    def info(self, name):
+        """Returns the cached metadata of a pattern without decoding it.
+
+        ``name`` is as listed by ``names``: the pattern's own name, followed
+        by its file name when several files share it.
+        """
+        return self.entries[name]
+
+    def load(self, name):
+        """Decodes a pattern from the library by name."""
+        entry = self.entries[name]
+        return read_pattern(os.path.join(self.directory, entry["file"]), entry["name"])
@@ -0,0 +1,164 @@
+import mmap
+import struct
+import zlib
+import numpy as np
+
+MAGIC = b"LIFEREC1"
+INDEX_MAGIC = b"LIFEIDX1"
+VERSION = 1
+DEFAULT_KEYFRAME_INTERVAL = 256
+
+HEADER = struct.Struct("<8sHIII")  # magic, version, rows, cols, keyframe interval
+FRAME_HEADER = struct.Struct("<BI")  # kind, payload length
+TRAILER = struct.Struct("<Q8s")  # offset of the index frame, index magic
+
+KEYFRAME, DELTA, INDEX = 0, 1, 2
+
+
+class Recorder:
+    """Streams generations of a board to a compact file.
+
+    Every frame is bit-packed and zlib-compressed. Every
+    ``keyframe_interval``-th frame stores the whole board; the frames in
+    between store the XOR with the previous generation, which is mostly
+    zeros and compresses to a few bytes. ``close`` appends an index of frame
+    offsets so ``Recording`` can seek without scanning; a file that was never
+    closed is still readable, just slower to open.
+    """
+
+    def __init__(self, path, rows, cols, keyframe_interval=DEFAULT_KEYFRAME_INTERVAL, compression=1):
+        self.path = path
+        self.rows = rows
+        self.cols = cols
+        self.keyframe_interval = keyframe_interval
+        self.compression = compression
+        self.offsets = []
+        self._previous = None
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, rows, cols, keyframe_interval))
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def write(self, board):
+        """Appends the next generation."""
+        board = np.asarray(board, dtype=np.uint8)
+        if board.shape != (self.rows, self.cols):
+            raise ValueError(f"Expected a {self.rows}x{self.cols} board, got {board.shape[0]}x{board.shape[1]}")
+        bits = np.packbits(board != 0)
+        if len(self.offsets) % self.keyframe_interval == 0:
+            kind, payload = KEYFRAME, bits
+        else:
+            kind, payload = DELTA, bits ^ self._previous
+        self._previous = bits
+        self.offsets.append(self._file.tell())
+        self._write_frame(kind, zlib.compress(payload.tobytes(), self.compression))
+
+    def _write_frame(self, kind, data):
+        self._file.write(FRAME_HEADER.pack(kind, len(data)))
+        self._file.write(data)
+
+    def close(self):
+        """Writes the frame index and closes the file."""
+        if self._file.closed:
+            return
+        index_offset = self._file.tell()
+        self._write_frame(INDEX, np.array(self.offsets, dtype="<u8").tobytes())
+        self._file.write(TRAILER.pack(index_offset, INDEX_MAGIC))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class Recording:
+    """Random-access reader for files written by ``Recorder``.
+
+    The file is memory-mapped, so only the frames needed to rebuild a
+    generation are touched: the keyframe at or before it and the deltas up
+    to it. The last decoded generation is kept, so scrubbing forward replays
+    just the new deltas.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = None
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)  # ValueError if empty
+            magic, version, self.rows, self.cols, self.keyframe_interval = HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a Game of Life recording")
+            if version != VERSION:
+                raise ValueError(f"Unsupported recording version {version}")
+            self.offsets = self._read_index()
+        except struct.error:
+            self.close()
+            raise ValueError(f"{path} is truncated") from None
+        except BaseException:
+            self.close()
+            raise
+        self._cached = None  # (generation, packed bits) of the last decoded frame
+
+    def _read_index(self):
+        size = len(self._map)
+        if size >= HEADER.size + TRAILER.size:
+            index_offset, magic = TRAILER.unpack_from(self._map, size - TRAILER.size)
+            if magic == INDEX_MAGIC:
+                kind, length = FRAME_HEADER.unpack_from(self._map, index_offset)
+                start = index_offset + FRAME_HEADER.size
+                return np.frombuffer(self._map[start:start + length], dtype="<u8").astype(np.int64)
+
+        # No index (the recorder was not closed): walk the frame headers
+        offsets = []
+        position = HEADER.size
+        while position + FRAME_HEADER.size <= size:
+            kind, length = FRAME_HEADER.unpack_from(self._map, position)
+            if kind not in (KEYFRAME, DELTA) or position + FRAME_HEADER.size + length > size:
+                break
+            offsets.append(position)
+            position += FRAME_HEADER.size + length
+        return np.array(offsets, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def _frame_bits(self, index):
+        position = int(self.offsets[index])
+        kind, length = FRAME_HEADER.unpack_from(self._map, position)
+        start = position + FRAME_HEADER.size
+        try:
+            return kind, np.frombuffer(zlib.decompress(self._map[start:start + length]), dtype=np.uint8)
+        except zlib.error as error:
+            raise ValueError(f"Frame {index} of {self.path} is corrupt: {error}") from None
+
+    def frame(self, generation):
+        """Returns the board recorded for a generation as a uint8 array."""
+        if not 0 <= generation < len(self.offsets):
+            raise IndexError(f"Generation {generation} is not in the recording (0-{len(self.offsets) - 1})")
+        keyframe = generation - generation % self.keyframe_interval
+        if self._cached is not None and keyframe <= self._cached[0] <= generation:
+            first, bits = self._cached[0] + 1, self._cached[1]
+        else:
+            first, bits = keyframe + 1, self._frame_bits(keyframe)[1]
+
+        for index in range(first, generation + 1):
+            bits = bits ^ self._frame_bits(index)[1]
+        self._cached = (generation, bits)
+        return np.unpackbits(bits, count=self.rows * self.cols).reshape(self.rows, self.cols)
+
+    __getitem__ = frame
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
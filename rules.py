@@ -0,0 +1,96 @@
+import functools
+import re
+import numpy as np
+
+DEFAULT_RULE = "B3/S23"
+
+_BS_RULE = re.compile(r"^B([0-8]*)/S([0-8]*)$", re.IGNORECASE)
+_SB_RULE = re.compile(r"^S?([0-8]*)/B?([0-8]*)$", re.IGNORECASE)  # Legacy "23/3" survival/birth order
+
+
+class Rule:
+    """An outer-totalistic Life-like rule compiled to lookup tables.
+
+    ``table[alive, count]`` is the next state of a cell given its own state
+    and its number of alive neighbours; ``lookup[2 * count + alive]`` is the
+    same table flattened so a whole board steps with one ``np.take``.
+    ``block_table`` maps a 4x4 block (16 bits, row-major, bit 15 first) to
+    the next state of its centre 2x2 (4 bits: nw, ne, sw, se), for HashLife
+    leaves. Backends only ever consult these tables, so any rule runs
+    through the same step code.
+    """
+
+    def __init__(self, birth, survival):
+        self.birth = frozenset(birth)
+        self.survival = frozenset(survival)
+        self.table = np.zeros((2, 9), dtype=np.uint8)
+        self.table[0, sorted(self.birth)] = 1
+        self.table[1, sorted(self.survival)] = 1
+        self.lookup = np.ascontiguousarray(self.table.T).ravel()
+        self._block_table = None
+
+    def __str__(self):
+        return f"B{''.join(map(str, sorted(self.birth)))}/S{''.join(map(str, sorted(self.survival)))}"
+
+    def __repr__(self):
+        return f"Rule('{self}')"
+
+    def __eq__(self, other):
+        if not isinstance(other, Rule):
+            return NotImplemented
+        return self.birth == other.birth and self.survival == other.survival
+
+    def __hash__(self):
+        return hash((self.birth, self.survival))
+
+    def __reduce__(self):
+        return parse_rule, (str(self),)  # Pickle as the rulestring; tables are rebuilt on load
+
+    @property
+    def births_from_nothing(self):
+        """True for B0 rules, where empty space comes alive and an unbounded plane fills up."""
+        return 0 in self.birth
+
+    def next_state(self, alive, count):
+        return int(self.table[alive, count])
+
+    def apply(self, alive, counts):
+        """Returns the next states of uint8 cells given their neighbour counts."""
+        return np.take(self.lookup, counts * 2 + alive)
+
+    @property
+    def block_table(self):
+        if self._block_table is None:
+            blocks = np.arange(1 << 16, dtype=np.uint32)
+            cells = ((blocks[:, None] >> np.arange(15, -1, -1, dtype=np.uint32)) & 1).astype(np.uint8).reshape(-1, 4, 4)
+            result = np.zeros(len(blocks), dtype=np.uint8)
+            for bit, (x, y) in zip((3, 2, 1, 0), ((1, 1), (1, 2), (2, 1), (2, 2))):
+                counts = cells[:, x - 1:x + 2, y - 1:y + 2].sum(axis=(1, 2), dtype=np.uint8) - cells[:, x, y]
+                result |= self.apply(cells[:, x, y], counts) << bit
+            self._block_table = result
+        return self._block_table
+
+
+@functools.lru_cache(maxsize=None)
+def parse_rule(text):
+    """Compiles a rulestring such as "B3/S23", "B36/S23" (HighLife) or the legacy "23/3"."""
+    text = text.strip().replace(" ", "")
+    match = _BS_RULE.match(text)
+    if match is not None:
+        birth, survival = match.groups()
+    else:
+        match = _SB_RULE.match(text)
+        if match is None:
+            raise ValueError(f"Not a Life-like rulestring: '{text}', expected e.g. 'B3/S23'")
+        survival, birth = match.groups()
+    return Rule(map(int, birth), map(int, survival))
+
+
+def get_rule(rule=None):
+    """Returns a compiled Rule from a Rule, a rulestring, or None for Conway's B3/S23."""
+    if isinstance(rule, Rule):
+        return rule
+    return parse_rule(rule or DEFAULT_RULE)
+
+
+CONWAY = parse_rule(DEFAULT_RULE)
@@ -0,0 +1,168 @@
+import hashlib
+import numpy as np
+from rules import CONWAY
+
+DEFAULT_TILE = 64
+
+# Offsets of the eight tiles (or cells) surrounding a tile, as (row, column) shifts
+NEIGHBORS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+class SparseBoard:
+    """An effectively infinite board stored as a dict of live tiles.
+
+    Only ``tile`` x ``tile`` blocks that contain live cells are allocated,
+    keyed by (tile_row, tile_col); coordinates may be negative. A step only
+    visits live tiles and the neighbours their edge cells can reach, so
+    memory and time follow the live population rather than the bounding box.
+    ``view`` is the (x0, y0, rows, cols) window returned by ``to_array``.
+    """
+
+    def __init__(self, tile=DEFAULT_TILE, view=(0, 0, 0, 0)):
+        self.tile = tile
+        self.tiles = {}
+        self.view = view
+
+    @classmethod
+    def from_array(cls, board, x0=0, y0=0, tile=DEFAULT_TILE):
+        """Builds a sparse board from a uint8 array placed with its top-left cell at (x0, y0)."""
+        board = np.array(board, dtype=np.uint8, ndmin=2)
+        sparse = cls(tile, (x0, y0) + board.shape)
+        sparse.paste(board, x0, y0)
+        return sparse
+
+    def copy(self):
+        sparse = SparseBoard(self.tile, self.view)
+        sparse.tiles = {key: cells.copy() for key, cells in self.tiles.items()}
+        return sparse
+
+    def _tile_ranges(self, x0, y0, rows, cols):
+        tile = self.tile
+        for i in range(x0 // tile, (x0 + rows - 1) // tile + 1):
+            for j in range(y0 // tile, (y0 + cols - 1) // tile + 1):
+                # Overlap of tile (i, j) with the window, in tile and in window coordinates
+                top, left = max(x0, i * tile), max(y0, j * tile)
+                bottom, right = min(x0 + rows, (i + 1) * tile), min(y0 + cols, (j + 1) * tile)
+                yield (i, j), (slice(top - i * tile, bottom - i * tile), slice(left - j * tile, right - j * tile)), \
+                    (slice(top - x0, bottom - x0), slice(left - y0, right - y0))
+
+    def paste(self, board, x0=0, y0=0):
+        """Replaces the cells of the window starting at (x0, y0) with a uint8 array."""
+        board = np.asarray(board, dtype=np.uint8) != 0
+        rows, cols = board.shape
+        if not rows or not cols:
+            return self
+        for key, tile_slice, board_slice in self._tile_ranges(x0, y0, rows, cols):
+            cells = self.tiles.get(key)
+            block = board[board_slice]
+            if cells is None:
+                if not block.any():
+                    continue
+                cells = self.tiles[key] = np.zeros((self.tile, self.tile), dtype=np.uint8)
+            cells[tile_slice] = block
+            if not cells.any():
+                del self.tiles[key]
+        return self
+
+    def to_array(self, x0=None, y0=None, rows=None, cols=None):
+        """Renders a window of the plane into a uint8 array (the ``view`` window by default)."""
+        view_x0, view_y0, view_rows, view_cols = self.view
+        x0 = view_x0 if x0 is None else x0
+        y0 = view_y0 if y0 is None else y0
+        rows = view_rows if rows is None else rows
+        cols = view_cols if cols is None else cols
+        window = np.zeros((rows, cols), dtype=np.uint8)
+        if rows and cols:
+            for key, tile_slice, board_slice in self._tile_ranges(x0, y0, rows, cols):
+                cells = self.tiles.get(key)
+                if cells is not None:
+                    window[board_slice] = cells[tile_slice]
+        return window
+
+    def population(self):
+        return int(sum(int(cells.sum()) for cells in self.tiles.values()))
+
+    def nbytes(self):
+        return sum(cells.nbytes for cells in self.tiles.values())
+
+    def bounding_box(self):
+        """Returns (min_x, min_y, max_x, max_y) of the live cells, or None if the board is empty."""
+        box = None
+        for (i, j), cells in self.tiles.items():
+            xs, ys = np.nonzero(cells)
+            tile_box = (i * self.tile + xs.min(), j * self.tile + ys.min(), i * self.tile + xs.max(), j * self.tile + ys.max())
+            box = tile_box if box is None else (min(box[0], tile_box[0]), min(box[1], tile_box[1]),
+                                                max(box[2], tile_box[2]), max(box[3], tile_box[3]))
+        return None if box is None else tuple(int(value) for value in box)
+
+    def digest(self):
+        """Returns a hash of the whole plane, used for cycle detection."""
+        digest = hashlib.blake2b(digest_size=16)
+        for key in sorted(self.tiles):
+            digest.update(np.array(key, dtype=np.int64).tobytes())
+            digest.update(self.tiles[key].tobytes())
+        return digest.digest()
+
+    def _candidates(self):
+        """Returns the live tiles plus every neighbour that a live edge cell can reach."""
+        candidates = set(self.tiles)
+        for (i, j), cells in self.tiles.items():
+            top, bottom, left, right = cells[0].any(), cells[-1].any(), cells[:, 0].any(), cells[:, -1].any()
+            if top:
+                candidates.add((i - 1, j))
+            if bottom:
+                candidates.add((i + 1, j))
+            if left:
+                candidates.add((i, j - 1))
+            if right:
+                candidates.add((i, j + 1))
+            if cells[0, 0]:
+                candidates.add((i - 1, j - 1))
+            if cells[0, -1]:
+                candidates.add((i - 1, j + 1))
+            if cells[-1, 0]:
+                candidates.add((i + 1, j - 1))
+            if cells[-1, -1]:
+                candidates.add((i + 1, j + 1))
+        return list(candidates)
+
+    def step(self, boundary="infinite", rule=CONWAY):
+        """Advances the board by one generation in place and returns it."""
+        if boundary != "infinite":
+            raise ValueError(f"SparseBoard only supports the 'infinite' boundary, not '{boundary}'")
+        if rule.births_from_nothing:
+            raise ValueError(f"Rule {rule} brings empty cells to life, which an infinite board cannot hold")
+        candidates = self._candidates()
+        if not candidates:
+            return self
+
+        tile = self.tile
+        windows = np.zeros((len(candidates), tile + 2, tile + 2), dtype=np.uint8)
+        for index, (i, j) in enumerate(candidates):
+            # Each window is the tile plus a one-cell border taken from its neighbours
+            window = windows[index]
+            get = self.tiles.get
+            cells = get((i, j))
+            if cells is not None:
+                window[1:-1, 1:-1] = cells
+            for dx, dy in NEIGHBORS:
+                neighbor = get((i + dx, j + dy))
+                if neighbor is None:
+                    continue
+                rows = slice(1, -1) if dx == 0 else (0 if dx < 0 else -1)
+                cols = slice(1, -1) if dy == 0 else (0 if dy < 0 else -1)
+                source_rows = slice(None) if dx == 0 else (-1 if dx < 0 else 0)
+                source_cols = slice(None) if dy == 0 else (-1 if dy < 0 else 0)
+                window[rows, cols] = neighbor[source_rows, source_cols]
+
+        counts = np.zeros((len(candidates), tile, tile), dtype=np.uint8)
+        for dx in range(3):
+            for dy in range(3):
+                if dx != 1 or dy != 1:
+                    counts += windows[:, dx:dx + tile, dy:dy + tile]
+        alive = windows[:, 1:-1, 1:-1]
+        new = rule.apply(alive, counts)
+
+        live = new.reshape(len(candidates), -1).any(axis=1)
+        self.tiles = {candidates[index]: new[index].copy() for index in np.flatnonzero(live)}
+        return self
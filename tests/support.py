@@ -0,0 +1,41 @@
+"""Boards and reference runs shared by the tests."""
+import numpy as np
+import engine
+from rules import get_rule
+
+RULES = ["B3/S23", "B36/S23", "B2/S", "B3678/S34678", "B0/S8"]
+UNBOUNDED_RULES = [rule for rule in RULES if not get_rule(rule).births_from_nothing]
+GENERATIONS = 12
+
+
+def soups(rows=19, cols=23, count=3):
+    """Seeded random boards; odd sizes exercise partial words, tiles and blocks."""
+    return [engine.generate_random_pattern(rows, cols, 0.35, seed) for seed in range(count)]
+
+
+def reference(board, generations, boundary="dead", rule="B3/S23"):
+    """Returns the board of every generation, stepped by ``step_numpy``."""
+    rule = get_rule(rule)
+    boards = [board]
+    for _ in range(generations):
+        boards.append(engine.step_numpy(boards[-1], boundary, rule))
+    return boards
+
+
+def padded_reference(board, generations, rule="B3/S23"):
+    """Runs a board on a dead-edged plane wide enough that nothing can reach the edge.
+
+    Returns the final plane and the margin added on every side.
+    """
+    margin = generations + 2
+    return reference(np.pad(board, margin), generations, "dead", rule)[-1], margin
+
+
+def assert_engine_matches(backend, boundary, rule, boards=None, generations=GENERATIONS):
+    """Steps each board with a backend and compares every generation with ``step_numpy``."""
+    for board in boards or soups():
+        expected = reference(board, generations, boundary, rule)
+        life = engine.LifeEngine(board=board, backend=backend, boundary=boundary, rule=rule)
+        for generation in range(1, generations + 1):
+            np.testing.assert_array_equal(life.step(), expected[generation], err_msg=f"generation {generation}")
+            assert life.population() == int(expected[generation].sum())
@@ -0,0 +1,31 @@
+"""Active-region stepping must give exactly the boards of ``step_numpy``."""
+import numpy as np
+import pytest
+import engine
+from support import RULES, assert_engine_matches, reference
+
+
+@pytest.mark.parametrize("rule", RULES)
+@pytest.mark.parametrize("boundary", ["dead", "torus"])
+def test_active_matches_numpy(boundary, rule):
+    assert_engine_matches("active", boundary, rule)
+
+
+@pytest.mark.parametrize("boundary", ["dead", "torus"])
+def test_activity_crossing_quiet_tiles(boundary):
+    # A glider travels through tiles that were inactive, and wraps on the torus
+    board = np.zeros((40, 40), dtype=np.uint8)
+    board[1, 2] = board[2, 3] = board[3, 1] = board[3, 2] = board[3, 3] = 1
+    board[30:32, 5:7] = 1  # A block that never changes
+    assert_engine_matches("active", boundary, "B3/S23", [board], generations=120)
+
+
+def test_edits_reactivate_tiles():
+    life = engine.LifeEngine(40, 40, backend="active")
+    life.run(3)
+    life.toggle(20, 19)
+    life.toggle(20, 20)
+    life.toggle(20, 21)
+    expected = reference(life.board.copy(), 2)
+    life.run(2)
+    np.testing.assert_array_equal(life.board, expected[-1])
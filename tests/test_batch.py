@@ -0,0 +1,36 @@
+"""Stepping a whole population at once must match stepping each board on its own."""
+import numpy as np
+import pytest
+import batch
+import engine
+from rules import get_rule
+from support import GENERATIONS, RULES, reference, soups
+
+
+@pytest.mark.parametrize("rule", RULES)
+@pytest.mark.parametrize("boundary", ["dead", "torus"])
+def test_batch_matches_numpy(boundary, rule):
+    boards = soups(count=4)
+    stepped = batch.run_batch(batch.to_batch(boards), GENERATIONS, boundary, get_rule(rule))
+    for board, result in zip(boards, stepped):
+        np.testing.assert_array_equal(result, reference(board, GENERATIONS, boundary, rule)[-1])
+
+
+@pytest.mark.parametrize("generations", [6, 7])
+def test_early_exit_keeps_oscillator_phase(generations):
+    blinker = np.zeros((5, 5), dtype=np.uint8)
+    blinker[2, 1:4] = 1
+    boards = batch.to_batch([blinker, np.zeros_like(blinker)])
+    result = batch.run_batch(boards, generations)
+    np.testing.assert_array_equal(result[0], reference(blinker, generations)[-1])
+
+
+def test_evaluate_batch_matches_evaluate_fitness():
+    boards = soups(rows=12, cols=12, count=8)
+    expected = [engine.evaluate_fitness(board, 15) for board in boards]
+    assert batch.evaluate_batch(boards, 15).tolist() == expected
+
+
+def test_infinite_boundary_rejected():
+    with pytest.raises(ValueError):
+        batch.step_batch(batch.to_batch(soups(count=1)), "infinite")
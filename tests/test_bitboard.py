@@ -0,0 +1,26 @@
+"""The bit-packed SWAR step must give exactly the boards of ``step_numpy``."""
+import numpy as np
+import pytest
+from bitboard import BitBoard
+from support import RULES, assert_engine_matches, soups
+
+
+@pytest.mark.parametrize("rule", RULES)
+@pytest.mark.parametrize("boundary", ["dead", "torus"])
+def test_bitpacked_matches_numpy(boundary, rule):
+    assert_engine_matches("bitpacked", boundary, rule)
+
+
+@pytest.mark.parametrize("cols", [1, 63, 64, 65, 130])
+def test_word_edges(cols):
+    # Widths around the 64-bit word size, where carries between words happen
+    boards = soups(rows=9, cols=cols, count=2)
+    assert_engine_matches("bitpacked", "torus", "B3/S23", boards)
+    assert_engine_matches("bitpacked", "dead", "B3/S23", boards)
+
+
+def test_pack_round_trip():
+    board = soups(rows=7, cols=70, count=1)[0]
+    packed = BitBoard.from_array(board)
+    np.testing.assert_array_equal(packed.to_array(), board)
+    assert packed.population() == int(board.sum())
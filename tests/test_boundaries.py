@@ -0,0 +1,64 @@
+"""Torus wrapping and the unbounded sparse plane must match the NumPy reference exactly."""
+import numpy as np
+import pytest
+import engine
+from rules import get_rule
+from sparse import SparseBoard
+from support import GENERATIONS, UNBOUNDED_RULES, padded_reference, reference, soups
+
+
+def glider(rows=8, cols=8):
+    board = np.zeros((rows, cols), dtype=np.uint8)
+    board[1, 2] = board[2, 3] = board[3, 1] = board[3, 2] = board[3, 3] = 1
+    return board
+
+
+def test_torus_glider_returns_home():
+    board = glider()
+    life = engine.LifeEngine(board=board, boundary="torus")
+    life.run(4 * 8)  # Moves one cell diagonally every 4 generations around an 8x8 torus
+    np.testing.assert_array_equal(life.board, board)
+
+
+def test_torus_wraps_like_a_tiled_plane():
+    board = soups(rows=10, cols=13, count=1)[0]
+    tiled = np.tile(board, (3, 3))
+    expected = reference(tiled, 5, "dead")[-1][10:20, 13:26]  # The centre tile is unaffected by the edges for 5 steps
+    np.testing.assert_array_equal(reference(board, 5, "torus")[-1], expected)
+
+
+@pytest.mark.parametrize("rule", UNBOUNDED_RULES)
+def test_sparse_matches_padded_numpy(rule):
+    for board in soups():
+        expected, margin = padded_reference(board, GENERATIONS, rule)
+        state = SparseBoard.from_array(board, tile=8)  # Small tiles so patterns cross tile edges
+        for _ in range(GENERATIONS):
+            state = state.step("infinite", get_rule(rule))
+        window = state.to_array(-margin, -margin, expected.shape[0], expected.shape[1])
+        np.testing.assert_array_equal(window, expected)
+        assert state.population() == int(expected.sum())
+
+
+def test_infinite_engine_keeps_cells_past_the_window():
+    life = engine.LifeEngine(board=glider(), boundary="infinite")
+    assert life.backend.name == "sparse"
+    life.run(4 * 20)
+    assert not life.board.any()  # The glider has left the visible window...
+    assert life.population() == 5  # ...but still exists on the plane
+    assert life.bounding_box() == (21, 21, 23, 23)
+    np.testing.assert_array_equal(life.live_cells(), glider()[1:4, 1:4])
+
+
+def test_infinite_boundary_rejects_births_from_nothing():
+    with pytest.raises(ValueError):
+        engine.LifeEngine(5, 5, boundary="infinite", rule="B0/S8")
+
+
+def test_switching_boundary_keeps_the_visible_board():
+    board = soups(count=1)[0]
+    life = engine.LifeEngine(board=board, backend="bitpacked")
+    life.set_boundary("torus")
+    assert life.backend.name == "bitpacked"
+    life.set_boundary("infinite")
+    assert life.backend.name == "sparse"
+    np.testing.assert_array_equal(life.board, board)
@@ -0,0 +1,75 @@
+"""Checkpoints must round-trip exactly and resume to the result of an uninterrupted run."""
+import random
+import numpy as np
+import pytest
+import evolution
+from checkpoint import Checkpoint, load_checkpoint, save_checkpoint
+
+SETTINGS = dict(rows=12, cols=12, generations=6, population_size=10, fitness_generations=8)
+
+
+def test_round_trip(tmp_path):
+    rng = random.Random(5)
+    population = np.stack([evolution.random_pattern(9, 13, rng) for _ in range(4)])
+    original = Checkpoint("evolve", 3, population, [4, 9, 1, 0], [7, 9], rng.getstate(), {"rows": 9, "cols": 13})
+    path = str(tmp_path / "run.npz")
+    save_checkpoint(path, original)
+    loaded = load_checkpoint(path)
+    assert (loaded.kind, loaded.generation, loaded.params) == ("evolve", 3, {"rows": 9, "cols": 13})
+    np.testing.assert_array_equal(loaded.population, population)
+    assert loaded.scores == [4, 9, 1, 0] and loaded.fitness_history == [7, 9]
+    assert loaded.rng_state == rng.getstate()
+
+
+def test_float_scores_round_trip(tmp_path):
+    path = str(tmp_path / "run.npz")
+    save_checkpoint(path, Checkpoint("evolve", 1, np.zeros((2, 3, 3), np.uint8), [0.5, 1.25], [1.25],
+                                     random.Random(1).getstate(), {}))
+    assert load_checkpoint(path).scores == [0.5, 1.25]
+
+
+def interrupted(run, tmp_path, stop_at, **options):
+    """Runs until ``stop_at`` generations, as if killed there, then resumes to the end."""
+    path = str(tmp_path / "run.npz")
+
+    def stop(generation, generations, best_fitness):
+        if generation > stop_at:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        run(checkpoint=path, on_generation=stop, **options)
+    assert load_checkpoint(path).generation == stop_at
+    return run(checkpoint=path, resume=True, **options)
+
+
+def assert_same_result(resumed, expected):
+    np.testing.assert_array_equal(resumed.best_pattern, expected.best_pattern)
+    assert resumed.best_fitness == expected.best_fitness
+    assert resumed.fitness_history == expected.fitness_history
+
+
+@pytest.mark.parametrize("objective", [None, "longevity=1,growth=0.5"])
+def test_evolve_resume_is_exact(tmp_path, objective):
+    expected = evolution.evolve(rng=random.Random(3), objective=objective, **SETTINGS)
+    resumed = interrupted(lambda **options: evolution.evolve(rng=random.Random(3), objective=objective, **options),
+                          tmp_path, 3, **SETTINGS)
+    assert_same_result(resumed, expected)
+
+
+def test_evolve_batch_resume_is_exact(tmp_path):
+    expected = evolution.evolve_batch(seed=3, **SETTINGS)
+    resumed = interrupted(lambda **options: evolution.evolve_batch(seed=3, **options), tmp_path, 3, **SETTINGS)
+    assert_same_result(resumed, expected)
+
+
+def test_resume_rejects_other_settings(tmp_path):
+    path = str(tmp_path / "run.npz")
+    evolution.evolve(rng=random.Random(3), checkpoint=path, **SETTINGS)
+    with pytest.raises(ValueError):
+        evolution.evolve(rng=random.Random(3), checkpoint=path, resume=True, **dict(SETTINGS, rows=13))
+
+
+@pytest.mark.parametrize("run", [evolution.evolve, evolution.evolve_batch])
+def test_checkpoint_every_must_be_positive(tmp_path, run):
+    with pytest.raises(ValueError):
+        run(checkpoint=str(tmp_path / "run.npz"), checkpoint_every=0, **SETTINGS)
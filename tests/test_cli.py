@@ -0,0 +1,54 @@
+"""The CLI must reject bad options up front and write reproducible JSON lines."""
+import json
+import pytest
+import cli
+
+
+@pytest.mark.parametrize("argv", [
+    ["evolve", "--rule", "X9"],
+    ["evolve", "--backend", "sparse"],
+    ["evolve", "--batch", "--boundary", "infinite"],
+    ["evolve", "--batch", "--objective", "growth"],
+    ["evolve", "--objective", "nope"],
+    ["evolve", "--runs", "2", "--checkpoint", "run.npz"],
+    ["evolve", "--population", "3"],
+    ["evolve", "--rows", "0"],
+    ["evolve", "--generations", "-1"],
+    ["evolve", "--checkpoint", "run.npz", "--checkpoint-every", "0"],
+    ["simulate", "--rule", "B3/S23", "B0/S8", "--boundary", "infinite"],
+    ["simulate", "--density", "2"],
+    ["simulate", "--count", "-1"],
+])
+def test_invalid_options_exit_with_a_usage_error(argv, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        cli.main(argv)
+    assert exit_info.value.code == 2
+    assert "error:" in capsys.readouterr().err
+
+
+def read_records(path):
+    with open(path, encoding="utf-8") as stream:
+        records = [json.loads(line) for line in stream]
+    for record in records:
+        record.pop("seconds", None)
+    return records
+
+
+def test_evolve_output_is_reproducible(tmp_path):
+    argv = ["evolve", "--rows", "10", "--cols", "10", "--population", "8", "--generations", "3", "--seed", "4",
+            "--runs", "2", "--progress"]
+    cli.main(argv + ["--output", str(tmp_path / "a.jsonl")])
+    cli.main(argv + ["--output", str(tmp_path / "b.jsonl")])
+    records = read_records(tmp_path / "a.jsonl")
+    assert records == read_records(tmp_path / "b.jsonl")
+    results = [record for record in records if record["type"] == "result"]
+    assert [record["seed"] for record in results] == [4, 5]
+    assert all(len(record["fitness_history"]) == 3 for record in results)
+
+
+def test_simulate_writes_one_record_per_soup(tmp_path):
+    path = tmp_path / "soups.jsonl"
+    cli.main(["simulate", "--rule", "B3/S23", "B36/S23", "--count", "3", "--steps", "30", "--output", str(path)])
+    records = read_records(path)
+    assert [(record["rule"], record["seed"]) for record in records] == [
+        (rule, seed) for rule in ("B3/S23", "B36/S23") for seed in range(3)]
@@ -0,0 +1,47 @@
+"""Cycle detection may stop simulating early, but never change the result."""
+import numpy as np
+import pytest
+import engine
+from support import reference, soups
+
+
+def blinker():
+    board = np.zeros((7, 7), dtype=np.uint8)
+    board[3, 2:5] = 1
+    return board
+
+
+@pytest.mark.parametrize("generations", [7, 8, 100])
+def test_skipping_periods_matches_stepping(generations):
+    for board in [blinker()] + soups(rows=12, cols=12):
+        skipped = engine.LifeEngine(board=board).run(generations, detect_cycles=True)
+        np.testing.assert_array_equal(skipped, reference(board, generations)[-1])
+
+
+def test_cycle_kinds():
+    life = engine.LifeEngine(board=blinker())
+    cycle = life.find_cycle(10)
+    assert (cycle.start, cycle.period, cycle.extinct) == (0, 2, False)
+
+    block = np.zeros((4, 4), dtype=np.uint8)
+    block[1:3, 1:3] = 1
+    assert engine.LifeEngine(board=block).find_cycle(10).period == 1
+
+    single = np.zeros((4, 4), dtype=np.uint8)
+    single[1, 1] = 1
+    cycle = engine.LifeEngine(board=single).find_cycle(10)
+    assert (cycle.start, cycle.period, cycle.extinct) == (1, 1, True)
+
+
+def test_no_cycle_within_the_limit():
+    glider = np.zeros((20, 20), dtype=np.uint8)
+    glider[1, 2] = glider[2, 3] = glider[3, 1] = glider[3, 2] = glider[3, 3] = 1
+    life = engine.LifeEngine(board=glider, boundary="torus")
+    assert life.find_cycle(10) is None
+    assert life.generation == 10
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy", "bitpacked", "active"])
+def test_evaluate_fitness_matches_full_run(backend):
+    for board in soups(rows=12, cols=12):
+        assert engine.evaluate_fitness(board, 60, backend) == int(reference(board, 60)[-1].sum())
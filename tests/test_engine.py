@@ -0,0 +1,32 @@
+"""The vectorized NumPy step must give exactly the boards of the original per-cell loop."""
+import numpy as np
+import pytest
+import engine
+from support import assert_engine_matches, reference, soups
+
+
+@pytest.mark.parametrize("boundary", ["dead", "torus"])
+def test_python_loop_matches_numpy(boundary):
+    assert_engine_matches("python", boundary, "B3/S23")
+
+
+def test_known_oscillator_and_still_life():
+    board = np.zeros((6, 6), dtype=np.uint8)
+    board[1, 1:4] = 1  # Blinker
+    board[4:6, 4:6] = 1  # Block in the corner, touching the dead edge
+    stepped = engine.step(board)
+    expected = np.zeros_like(board)
+    expected[0:3, 2] = 1
+    expected[4:6, 4:6] = 1
+    np.testing.assert_array_equal(stepped, expected)
+    np.testing.assert_array_equal(engine.step(stepped), board)
+
+
+def test_engine_keeps_its_own_copy_of_the_board():
+    board = soups(count=1)[0]
+    original = board.copy()
+    life = engine.LifeEngine(board=board)
+    life.run(5)
+    np.testing.assert_array_equal(board, original)
+    np.testing.assert_array_equal(life.board, reference(original, 5)[-1])
+    assert life.generation == 5
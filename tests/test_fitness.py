@@ -0,0 +1,71 @@
+"""Fitness scores must not depend on how the population is split across processes or cached."""
+import numpy as np
+import pytest
+import engine
+import fitness
+
+
+def population(count, rows=12, cols=12):
+    return [engine.generate_random_pattern(rows, cols, 0.4, seed) for seed in range(count)]
+
+
+def test_pool_matches_serial_scores():
+    patterns = population(fitness.MIN_CHUNK_SIZE * 2 + 5)
+    expected = [engine.evaluate_fitness(pattern, 15) for pattern in patterns]
+    executor = fitness.make_executor(2)
+    try:
+        assert fitness.evaluate_population(patterns, 15, executor=executor, workers=2) == expected
+        assert fitness.evaluate_population(patterns, 15, "bitpacked", executor=executor, workers=2) == expected
+    finally:
+        executor.shutdown()
+
+
+def test_cache_counts_hits_and_skips_duplicates():
+    patterns = population(6)
+    cache = fitness.FitnessCache()
+    first = fitness.evaluate_population(patterns + patterns[:2], 15, cache=cache)
+    assert first == [engine.evaluate_fitness(pattern, 15) for pattern in patterns + patterns[:2]]
+    assert (cache.stats()["misses"], cache.stats()["hits"], len(cache)) == (6, 2, 6)
+    assert fitness.evaluate_population(patterns, 15, cache=cache) == first[:6]
+    assert cache.stats()["hits"] == 8
+
+
+def test_symmetric_keys_share_mirror_images_only():
+    board = population(1)[0]
+    packed = fitness.pack_pattern
+    cache = fitness.FitnessCache(symmetric=True)
+    key = cache.key(packed(board), 10, "torus")
+    for variant in (board[::-1], board[:, ::-1], board.T, np.rot90(board)):
+        assert cache.key(packed(np.ascontiguousarray(variant)), 10, "torus") == key
+    assert cache.key(packed(np.roll(board, 1, axis=0)), 10, "torus") != key
+    assert cache.key(packed(board), 11, "torus") != key
+    plain = fitness.FitnessCache()
+    assert plain.key(packed(board[::-1].copy()), 10, "torus") != plain.key(packed(board), 10, "torus")
+
+
+def test_symmetric_cache_scores_are_exact():
+    patterns = population(5)
+    variants = [np.rot90(pattern).copy() for pattern in patterns]
+    cache = fitness.FitnessCache(symmetric=True)
+    fitness.evaluate_population(patterns, 20, cache=cache, boundary="torus")
+    assert fitness.evaluate_population(variants, 20, cache=cache, boundary="torus") == [
+        engine.evaluate_fitness(variant, 20, boundary="torus") for variant in variants]
+    assert cache.stats()["hits"] == 5
+
+
+def test_translation_keys_need_the_infinite_boundary():
+    board = np.zeros((10, 10), dtype=np.uint8)
+    board[2:5, 3] = 1
+    cache = fitness.FitnessCache(translation=True)
+    key = cache.key(fitness.pack_pattern(board), 10, "infinite")
+    assert cache.key(fitness.pack_pattern(np.roll(board, 4, axis=1)), 10, "infinite") == key
+    with pytest.raises(ValueError):
+        cache.key(fitness.pack_pattern(board), 10, "dead")
+
+
+def test_lru_eviction():
+    cache = fitness.FitnessCache(max_entries=2)
+    for name in "abc":
+        cache.put(name, 1)
+    assert cache.get("a") is None and cache.get("c") == 1
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,45 @@
+"""HashLife jumps must land on exactly the board that stepping one generation at a time gives."""
+import numpy as np
+import pytest
+from hashlife import HashLife
+from support import GENERATIONS, UNBOUNDED_RULES, padded_reference, soups
+
+
+@pytest.mark.parametrize("rule", UNBOUNDED_RULES)
+def test_jump_matches_padded_numpy(rule):
+    for board in soups():
+        expected, margin = padded_reference(board, GENERATIONS, rule)
+        life = HashLife(board, rule=rule).jump(GENERATIONS)
+        window = life.to_array(-margin, -margin, expected.shape[0], expected.shape[1])
+        np.testing.assert_array_equal(window, expected)
+        assert life.population() == int(expected.sum())
+
+
+def test_jumps_compose():
+    board = soups(count=1)[0]
+    once = HashLife(board).jump(100)
+    steps = HashLife(board)
+    for generations in (1, 2, 13, 84):
+        steps.jump(generations)
+    assert steps.generation == once.generation == 100
+    np.testing.assert_array_equal(steps.to_array(-120, -120, 260, 260), once.to_array(-120, -120, 260, 260))
+
+
+def test_glider_travels_without_clipping():
+    glider = np.array([[0, 1, 0], [0, 0, 1], [1, 1, 1]], dtype=np.uint8)
+    life = HashLife(glider).jump(4 * 1000)  # One cell down and right every 4 generations
+    assert life.population() == 5
+    assert life.bounding_box() == (1000, 1000, 1002, 1002)
+
+
+def test_garbage_collection_keeps_results():
+    board = soups(count=1)[0]
+    small = HashLife(board, max_nodes=2000).jump(500)
+    large = HashLife(board).jump(500)
+    assert small.population() == large.population()
+    np.testing.assert_array_equal(small.to_array(-520, -520, 1060, 1060), large.to_array(-520, -520, 1060, 1060))
+
+
+def test_births_from_nothing_rejected():
+    with pytest.raises(ValueError):
+        HashLife(rule="B0/S8")
@@ -0,0 +1,84 @@
+"""Objectives must all come from one simulation and agree with the engine's own measurements."""
+import numpy as np
+import pytest
+import engine
+import objectives
+from support import soups
+
+
+def glider(rows=20, cols=20):
+    board = np.zeros((rows, cols), dtype=np.uint8)
+    board[1, 2] = board[2, 3] = board[3, 1] = board[3, 2] = board[3, 3] = 1
+    return board
+
+
+def blinker():
+    board = np.zeros((8, 8), dtype=np.uint8)
+    board[3, 2:5] = 1
+    return board
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy", "bitpacked", "active"])
+@pytest.mark.parametrize("boundary", ["dead", "torus"])
+def test_population_matches_evaluate_fitness(backend, boundary):
+    for board in soups(rows=16, cols=16):
+        expected = engine.evaluate_fitness(board, 50, backend, boundary)
+        assert objectives.score(board, 50, "population=1,growth=0", backend, boundary) == expected
+
+
+def test_oscillator_objectives():
+    scores = {name: objectives.score(blinker(), 30, name) for name in objectives.OBJECTIVES}
+    assert scores == {"population": 3, "growth": 0.0, "longevity": 0, "bbox_expansion": 1.0, "period": 2,
+                      "gliders": 0}
+
+
+def test_glider_objectives_on_the_infinite_plane():
+    scores = {name: objectives.score(glider(), 30, name, boundary="infinite") for name in objectives.OBJECTIVES}
+    assert scores["longevity"] == 30  # A glider never repeats a position on the plane
+    assert scores["period"] == 0
+    assert scores["gliders"] == 1
+
+
+@pytest.mark.parametrize("generations", range(8))
+def test_gliders_counted_in_every_phase(generations):
+    assert objectives.score(glider(), generations, "gliders") == 1
+    for flipped in (glider()[::-1], glider()[:, ::-1], glider().T):
+        assert objectives.score(np.ascontiguousarray(flipped), generations, "gliders") == 1
+
+
+def test_growth_and_bbox_expansion():
+    r_pentomino = np.zeros((60, 60), dtype=np.uint8)
+    r_pentomino[29, 30:32] = r_pentomino[30, 29:31] = r_pentomino[31, 30] = 1
+    trace = objectives.trace(r_pentomino, 50, {"bounding_box"})
+    assert trace.initial_population == 5 and trace.initial_area == 9
+    assert objectives.score(r_pentomino, 50, "growth") == (trace.population - 5) / 5
+    assert objectives.score(r_pentomino, 50, "bbox_expansion") == trace.max_area / 9 > 1
+
+
+def test_weighted_sum_uses_one_trace():
+    board = soups(count=1)[0]
+    weights = "longevity=2,period=0.5,gliders=10"
+    expected = sum(weight * objectives.score(board, 40, name)
+                   for name, weight in (("longevity", 2), ("period", 0.5), ("gliders", 10)))
+    assert objectives.score(board, 40, weights) == expected
+
+
+def test_parse_and_canonical_key():
+    assert objectives.parse_objective(None) == {"population": 1}
+    assert objectives.parse_objective("growth=0.5, longevity") == {"growth": 0.5, "longevity": 1}
+    assert objectives.objective_key("period=0.5,longevity=2") == "longevity=2,period=0.5"
+    for bad in ("nope", "growth=x", ""):
+        with pytest.raises(ValueError):
+            objectives.parse_objective(bad)
+
+
+def test_evaluate_population_with_objective_and_cache():
+    import fitness
+    population = soups(count=6, rows=12, cols=12)
+    population += [population[0][::-1].copy(), population[1].T.copy()]  # Symmetric duplicates hit the cache
+    objective = "longevity=1,gliders=10"
+    serial = [objectives.score(board, 30, objective) for board in population]
+    cache = fitness.FitnessCache(symmetric=True)
+    assert list(fitness.evaluate_population(population, 30, cache=cache, objective=objective)) == serial
+    assert list(fitness.evaluate_population(population, 30, cache=cache, objective=objective)) == serial
+    assert cache.stats()["hits"] >= len(population)
@@ -0,0 +1,53 @@
+"""RLE and Life 1.06 must round-trip exactly, and the library must survive bad files."""
+import io
+import os
+import numpy as np
+import pytest
+import engine
+import patterns
+
+
+def sample():
+    cells = engine.generate_random_pattern(13, 37, 0.4, seed=7)
+    cells[5] = 0  # A blank row inside the pattern
+    return patterns.Pattern("Soup", cells, "B36/S23", ["seed 7"])
+
+
+def test_rle_round_trip():
+    text = io.StringIO()
+    patterns.write_rle(sample(), text)
+    pattern = patterns.parse_rle(text.getvalue())
+    np.testing.assert_array_equal(pattern.cells, sample().cells)
+    assert (pattern.name, pattern.rule, pattern.comments) == ("Soup", "B36/S23", ["seed 7"])
+    assert all(len(line) <= patterns.RLE_LINE_LENGTH for line in text.getvalue().splitlines()[3:])
+
+
+def test_life106_round_trip():
+    original = sample()
+    original.cells[0, 0] = original.cells[-1, -1] = 1  # Keep the declared extent
+    text = io.StringIO()
+    patterns.write_life106(original, text)
+    pattern = patterns.read_life106(io.StringIO(text.getvalue()))
+    np.testing.assert_array_equal(pattern.cells, original.cells)
+    assert pattern.name == "Soup"
+
+
+def test_rle_runs_past_the_header_are_rejected():
+    with pytest.raises(ValueError):
+        patterns.parse_rle("x = 2, y = 1\n3o!")
+
+
+def test_library_skips_bad_files_and_reuses_its_index(tmp_path):
+    patterns.write_rle(sample(), str(tmp_path / "soup.rle"))
+    patterns.write_rle(patterns.Pattern("Soup", np.ones((2, 2), np.uint8)), str(tmp_path / "block.rle"))
+    (tmp_path / "bad.rle").write_text("not a pattern\n")
+
+    library = patterns.PatternLibrary(str(tmp_path))
+    assert library.names() == ["Soup", "Soup (soup.rle)"]
+    assert list(library.errors) == ["bad.rle"]
+    np.testing.assert_array_equal(library.load("Soup (soup.rle)").cells, sample().cells)
+
+    index = tmp_path / patterns.INDEX_FILE
+    os.utime(index, (0, 0))
+    patterns.PatternLibrary(str(tmp_path))
+    assert index.stat().st_mtime == 0  # Nothing changed, so the index was not rewritten
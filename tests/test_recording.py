@@ -0,0 +1,41 @@
+"""Recordings must play back every generation exactly, in any seek order."""
+import numpy as np
+import pytest
+import engine
+import recording
+
+
+def record(path, generations=40, keyframe_interval=8, close=True):
+    life = engine.LifeEngine(board=engine.generate_random_pattern(17, 29, 0.4, seed=2), boundary="torus")
+    boards = [life.board.copy()]
+    recorder = recording.Recorder(path, life.rows, life.cols, keyframe_interval)
+    recorder.write(life.board)
+    for _ in range(generations):
+        boards.append(life.step().copy())
+        recorder.write(life.board)
+    if close:
+        recorder.close()
+    else:
+        recorder._file.close()  # As if the process died before writing the index
+    return boards
+
+
+@pytest.mark.parametrize("close", [True, False])
+def test_seek_matches_the_recorded_boards(tmp_path, close):
+    path = str(tmp_path / "run.liferec")
+    boards = record(path, close=close)
+    with recording.Recording(path) as playback:
+        assert len(playback) == len(boards)
+        order = list(range(len(boards))) + [3, 39, 0, 17, 16, 25, 8, 7]  # Forward, then jumping around keyframes
+        for generation in order:
+            np.testing.assert_array_equal(playback.frame(generation), boards[generation])
+        with pytest.raises(IndexError):
+            playback.frame(len(boards))
+
+
+@pytest.mark.parametrize("content", [b"", b"LIFE", b"NOTAREC1" + bytes(32)])
+def test_bad_files_raise_value_error(tmp_path, content):
+    path = tmp_path / "bad.liferec"
+    path.write_bytes(content)
+    with pytest.raises(ValueError):
+        recording.Recording(str(path))
@@ -0,0 +1,59 @@
+"""Rulestrings must compile to tables that every backend applies identically."""
+import numpy as np
+import pytest
+import engine
+from rules import CONWAY, get_rule, parse_rule
+from support import RULES, assert_engine_matches, soups
+
+
+@pytest.mark.parametrize("text, birth, survival", [
+    ("B3/S23", {3}, {2, 3}),
+    ("b36/s23", {3, 6}, {2, 3}),
+    ("23/3", {3}, {2, 3}),  # Legacy survival/birth order
+    ("B2/S", {2}, set()),
+])
+def test_parse(text, birth, survival):
+    rule = parse_rule(text)
+    for count in range(9):
+        assert rule.next_state(0, count) == (count in birth)
+        assert rule.next_state(1, count) == (count in survival)
+
+
+def test_canonical_form_and_default():
+    assert str(parse_rule("b36/s23")) == "B36/S23"
+    assert get_rule(None) == CONWAY and get_rule("23/3") == CONWAY
+
+
+@pytest.mark.parametrize("text", ["", "B9/S23", "Life", "B3/S2/3"])
+def test_invalid_rules(text):
+    with pytest.raises(ValueError):
+        parse_rule(text)
+
+
+@pytest.mark.parametrize("rule", RULES)
+def test_python_backend_follows_the_rule(rule):
+    assert_engine_matches("python", "torus", rule)
+
+
+def test_block_table_matches_the_cell_rule():
+    rule = get_rule("B36/S23")
+    for block in np.random.default_rng(0).integers(0, 1 << 16, 200):
+        cells = np.array([(int(block) >> (15 - bit)) & 1 for bit in range(16)], dtype=np.uint8).reshape(4, 4)
+        centre = engine.step_numpy(cells, "dead", rule)[1:3, 1:3].ravel()
+        expected = (int(centre[0]) << 3) | (int(centre[1]) << 2) | (int(centre[2]) << 1) | int(centre[3])
+        assert rule.block_table[block] == expected
+
+
+def test_set_rule_changes_the_step():
+    board = soups(count=1)[0]
+    life = engine.LifeEngine(board=board)
+    life.set_rule("B36/S23")
+    np.testing.assert_array_equal(life.step(), engine.step_numpy(board, "dead", get_rule("B36/S23")))
+
+
+def test_rejected_boundary_switch_leaves_engine_usable():
+    life = engine.LifeEngine(board=soups(count=1)[0], rule="B0/S8")
+    with pytest.raises(ValueError):
+        life.set_boundary("infinite")
+    assert life.boundary == "dead" and life.backend.name == "numpy"
+    life.step()
@@ -0,0 +1,156 @@
+import threading
+import numpy as np
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
+import evolution
+import metrics
+
+
+class Frame:
+    """A snapshot of the board published by the simulation worker."""
+
+    def __init__(self, board, generation, population):
+        self.board = board
+        self.generation = generation
+        self.population = population
+
+
+class FrameSlot:
+    """Holds only the latest published frame.
+
+    The worker overwrites the slot on every generation; the UI takes the
+    frame when it is ready to paint. Frames published in between are
+    dropped, so a fast simulation never builds up a queue of repaints.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._frame = None
+        self._pending = False
+
+    def put(self, frame):
+        """Stores a frame; returns True if the reader needs to be notified."""
+        with self._lock:
+            self._frame = frame
+            notify = not self._pending
+            self._pending = True
+        return notify
+
+    def take(self):
+        """Returns the latest frame (or None) and marks it consumed."""
+        with self._lock:
+            self._pending = False
+            return self._frame
+
+
+class SimulationWorker(QObject):
+    """Steps a LifeEngine on a background QThread.
+
+    The engine is shared with the UI; every access goes through ``lock``.
+    ``frameReady`` fires when a new frame is waiting in ``frames`` and the
+    previous one has been taken. When ``recorder`` is set (under ``lock``),
+    every generation is also streamed to it from the worker thread. Step
+    time, population and births/deaths per generation go to ``metrics``.
+    """
+
+    frameReady = pyqtSignal()
+
+    def __init__(self, engine, lock):
+        super().__init__()
+        self.engine = engine
+        self.lock = lock
+        self.frames = FrameSlot()
+        self.interval = 0
+        self.timer = None
+        self.recorder = None
+        self.metrics = metrics.REGISTRY
+        self._previous = None  # Board of the last tick, for counting births and deaths
+
+    @pyqtSlot()
+    def setup(self):
+        """Creates the timer in the worker thread; connect to QThread.started."""
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.tick)
+
+    @pyqtSlot()
+    def teardown(self):
+        """Stops and frees the timer in the worker thread; connect to QThread.finished."""
+        if self.timer is not None:
+            self.timer.stop()
+            self.timer.deleteLater()
+            self.timer = None
+
+    @pyqtSlot(int)
+    def start(self, interval):
+        self.set_interval(interval)
+        self.timer.start(interval)
+
+    @pyqtSlot()
+    def stop(self):
+        self.timer.stop()
+
+    @pyqtSlot(int)
+    def set_interval(self, interval):
+        """Sets the time between generations in milliseconds; 0 runs as fast as possible."""
+        self.interval = interval
+        if self.timer is not None:
+            self.timer.setInterval(interval)
+
+    @pyqtSlot()
+    def tick(self):
+        with self.lock:
+            with self.metrics.timer("step"):
+                self.engine.step()
+            frame = Frame(self.engine.board.copy(), self.engine.generation, self.engine.population())
+            if self.recorder is not None:
+                with self.metrics.timer("record"):
+                    self.recorder.write(frame.board)
+        if self.frames.put(frame):
+            self.frameReady.emit()
+
+        previous, self._previous = self._previous, frame.board
+        if previous is None or previous.shape != frame.board.shape:
+            births = deaths = 0
+        else:
+            births = int(np.count_nonzero(frame.board > previous))
+            deaths = int(np.count_nonzero(frame.board < previous))
+        self.metrics.increment("generations")
+        self.metrics.increment("births", births)
+        self.metrics.increment("deaths", deaths)
+        self.metrics.set_gauges(generation=frame.generation, population=frame.population, births=births, deaths=deaths)
+
+
+class EvolutionCancelled(Exception):
+    """Raised from the progress callback to abandon an evolution that was cancelled."""
+
+
+class EvolutionWorker(QObject):
+    """Runs an evolutionary search on a background QThread, reporting progress as it goes.
+
+    ``cancel`` may be called from any thread; the search stops at the end of
+    the generation in progress and ``finished`` is not emitted. A checkpoint,
+    if one is configured, is left behind so the search can be resumed.
+    """
+
+    progress = pyqtSignal(int, int, object)  # Best fitness is a float for objectives such as growth
+    finished = pyqtSignal(object)
+
+    def __init__(self, **evolve_args):
+        super().__init__()
+        self.evolve_args = evolve_args
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def _on_generation(self, generation, generations, best_fitness):
+        if self._cancelled.is_set():
+            raise EvolutionCancelled()
+        self.progress.emit(generation, generations, best_fitness)
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            result = evolution.evolve(on_generation=self._on_generation, **self.evolve_args)
+        except EvolutionCancelled:
+            return
+        self.finished.emit(result)